@@ -33,7 +33,7 @@ polymarketdata.co client::
     books  = client.get_books("some-market-slug",  start_ts="...", end_ts="...", resolution="1h")
 """
 
-from .exceptions import PolymarketAPIError
+from .exceptions import OrderBatchError, PolymarketAPIError
 # Analytics (primary)
 from .analytics import BacktestEngine, BacktestResult, Trade, TradeSignal, Signal
 # Clients
@@ -79,4 +79,5 @@ __all__ = [
     "PricePoint",
     # Errors
     "PolymarketAPIError",
+    "OrderBatchError",
 ]
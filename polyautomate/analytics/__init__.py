@@ -33,17 +33,19 @@ Quick start::
     print(result.summary())
 """
 
-from .engine import BacktestEngine
-from .models import BacktestResult, Trade, TradeSignal, Signal
+from .engine import BacktestEngine, BacktestJob
+from .models import BacktestResult, BookSnapshot, Trade, TradeSignal, Signal
 from .stats import wilson_ci, price_correlation_matrix, min_trades_for_significance
-from .indicators import compute_features, FEATURE_NAMES
+from .indicators import compute_features, compute_feature_matrix, FEATURE_NAMES
 from .strategies.optimal_entry import scan_optimal_entries, EntryProfile, ProfileStrategy
 from .strategies.rsi_mean_reversion import RSIMeanReversionStrategy
 from .strategies.macd_momentum import MACDMomentumStrategy
 
 __all__ = [
     "BacktestEngine",
+    "BacktestJob",
     "BacktestResult",
+    "BookSnapshot",
     "Trade",
     "TradeSignal",
     "Signal",
@@ -51,6 +53,7 @@ __all__ = [
     "price_correlation_matrix",
     "min_trades_for_significance",
     "compute_features",
+    "compute_feature_matrix",
     "FEATURE_NAMES",
     "scan_optimal_entries",
     "EntryProfile",
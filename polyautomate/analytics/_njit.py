@@ -0,0 +1,31 @@
+"""
+Optional Numba JIT.
+
+``njit`` is :func:`numba.njit` when Numba is installed and a no-op decorator
+otherwise, so kernels stay importable (and correct, if slow) without it.
+Callers that have a faster pure-NumPy path should branch on
+``HAVE_NUMBA`` rather than run an uncompiled scalar loop.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # pragma: no cover - optional dependency
+    HAVE_NUMBA = False
+
+    def njit(*args: Any, **kwargs: Any) -> Any:  # type: ignore[no-redef]
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorate(func: Callable) -> Callable:
+            return func
+
+        return decorate
+
+
+__all__ = ["HAVE_NUMBA", "njit"]
@@ -8,15 +8,24 @@ then simulates a strategy's performance by replaying bars in order.
 from __future__ import annotations
 
 import hashlib
+import itertools
 import json
 import logging
 import os
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Sequence
 
+import numpy as np
+
+from ..clients.base import _json_loads, orjson
 from ..clients.polymarketdata import PMDClient
-from .models import BacktestResult, Signal, Trade, TradeSignal
+from ._njit import njit
+from .models import BacktestResult, BookSnapshot, Signal, Trade, TradeSignal
 from .strategy import BaseStrategy
 
 logger = logging.getLogger(__name__)
@@ -44,16 +53,20 @@ def _cache_key(market_id: str, start_ts: Any, end_ts: Any, resolution: str) -> s
 def _cache_load(cache_dir: str, key: str) -> dict | None:
     path = os.path.join(cache_dir, f"{key}.json")
     if os.path.exists(path):
-        with open(path) as f:
-            return json.load(f)
+        with open(path, "rb") as f:
+            return _json_loads(f.read())
     return None
 
 
 def _cache_save(cache_dir: str, key: str, data: dict) -> None:
     os.makedirs(cache_dir, exist_ok=True)
     path = os.path.join(cache_dir, f"{key}.json")
-    with open(path, "w") as f:
-        json.dump(data, f)
+    # Write-then-rename so concurrent runs (e.g. run_batch workers) never
+    # read a half-written file.
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(orjson.dumps(data) if orjson is not None else json.dumps(data).encode())
+    os.replace(tmp, path)
 
 
 def _parse_ts(value: str | int | float) -> int:
@@ -90,6 +103,16 @@ def _extract_price_series(raw: list[dict]) -> list[dict]:
     return out
 
 
+def _sort_by_ts(series: list[dict]) -> list[dict]:
+    """
+    Sort *series* by ``ts`` in place and return it.  The API already returns
+    bars in time order, so the ordered case is a single pass with no sort.
+    """
+    if any(a["ts"] > b["ts"] for a, b in zip(series, islice(series, 1, None))):
+        series.sort(key=itemgetter("ts"))
+    return series
+
+
 def _extract_book_series(raw: list[dict]) -> list[dict]:
     """
     Normalise a raw book snapshot list.
@@ -108,6 +131,47 @@ def _extract_book_series(raw: list[dict]) -> list[dict]:
     return out
 
 
+@dataclass(frozen=True)
+class BacktestJob:
+    """
+    One :meth:`BacktestEngine.run` call for :meth:`BacktestEngine.run_batch`.
+
+    ``run_kwargs`` holds the keyword-only arguments of :meth:`~BacktestEngine.run`
+    (``stop_loss``, ``take_profit``, ...).  The strategy must be picklable.
+    """
+
+    strategy: BaseStrategy
+    market_id: str
+    token_label: str
+    start_ts: Any
+    end_ts: Any
+    resolution: str = "1h"
+    run_kwargs: dict[str, Any] = field(default_factory=dict)
+
+
+# Per-worker engine used by run_batch (set by ``_init_batch_worker``).
+_WORKER_ENGINE: BacktestEngine | None = None
+
+
+def _init_batch_worker(history_window: int, cache_dir: str) -> None:
+    global _WORKER_ENGINE
+    # Workers only read the disk cache the parent filled, so no client.
+    _WORKER_ENGINE = BacktestEngine(None, history_window=history_window, cache_dir=cache_dir)  # type: ignore[arg-type]
+
+
+def _run_batch_job(job: BacktestJob) -> BacktestResult:
+    assert _WORKER_ENGINE is not None
+    return _WORKER_ENGINE.run(
+        job.strategy,
+        job.market_id,
+        job.token_label,
+        job.start_ts,
+        job.end_ts,
+        job.resolution,
+        **job.run_kwargs,
+    )
+
+
 class BacktestEngine:
     """
     Drives a strategy against historical Polymarket data.
@@ -197,33 +261,10 @@ class BacktestEngine:
         -------
         BacktestResult
         """
-        logger.info(
-            "Fetching data for %s [%s] %s → %s @ %s",
-            market_id,
-            token_label,
-            start_ts,
-            end_ts,
-            resolution,
-        )
-
-        prices_by_label, books_by_label = self._fetch_data(
-            market_id, start_ts, end_ts, resolution
+        price_series, book_series = self._load_series(
+            market_id, token_label, start_ts, end_ts, resolution
         )
 
-        raw_prices = prices_by_label.get(token_label, [])
-        raw_books = books_by_label.get(token_label, [])
-
-        if not raw_prices:
-            raise ValueError(
-                f"No price data for token label '{token_label}' in market '{market_id}'. "
-                f"Available labels: {list(prices_by_label.keys())}"
-            )
-
-        # Normalise and align by timestamp
-        price_series = sorted(_extract_price_series(raw_prices), key=lambda x: x["ts"])
-        book_series = _extract_book_series(raw_books)
-        book_by_ts = {snap["ts"]: snap for snap in book_series}
-
         result = BacktestResult(
             market_id=market_id,
             token_label=token_label,
@@ -235,94 +276,254 @@ class BacktestEngine:
         # ------------------------------------------------------------------
         # Simulation loop
         # ------------------------------------------------------------------
-        open_trade: _OpenPosition | None = None
-        price_window: list[float] = []
-        book_window: list[dict] = []
-
-        for bar in price_series:
-            ts = bar["ts"]
-            price = bar["price"]
-            book = book_by_ts.get(ts, {"ts": ts, "bids": [], "asks": []})
-
-            price_window.append(price)
-            book_window.append(book)
-            if len(price_window) > self._history_window:
-                price_window.pop(0)
-                book_window.pop(0)
-
-            # ---- Manage open position ----
-            if open_trade is not None:
-                exit_reason = _check_exit(
-                    open_trade, price, stop_loss, take_profit, hold_periods
-                )
-                if exit_reason:
-                    exec_exit = _exit_exec_price(open_trade.signal.signal, book, price)
-                    trade = Trade(
-                        signal=open_trade.signal,
-                        entry_price=open_trade.entry_price,
-                        exit_price=exec_exit,
-                        exit_timestamp=ts,
-                        exit_reason=exit_reason,
-                        fee_rate=fee_rate,
-                    )
-                    result.trades.append(trade)
-                    logger.debug(
-                        "Exit  %s mid=%.4f exec=%.4f  [%s]  pnl=%.4f",
-                        open_trade.signal.signal.value,
-                        price,
-                        exec_exit,
-                        exit_reason,
-                        trade.pnl,
-                    )
-                    open_trade = None
-
-            # ---- Strategy evaluation (only enter if no open position) ----
-            if open_trade is None and len(price_window) >= self._history_window:
-                signal = strategy.on_step(
-                    timestamp=ts,
-                    price=price,
-                    book=book,
-                    price_history=list(price_window),
-                    book_history=list(book_window),
-                )
-                if signal is not None and signal.signal != Signal.HOLD:
-                    exec_entry = _entry_exec_price(signal.signal, book, price)
-                    open_trade = _OpenPosition(
-                        signal=signal,
-                        entry_price=exec_entry,
-                        entry_mid=price,
-                        bars_held=0,
-                    )
-                    logger.debug(
-                        "Entry %s mid=%.4f exec=%.4f  conf=%.2f",
-                        signal.signal.value,
-                        price,
-                        exec_entry,
-                        signal.confidence,
-                    )
-
-            if open_trade is not None:
-                open_trade.bars_held += 1
-
-        # Close any position still open at end of data (price_series already normalised)
-        if open_trade is not None and price_series:
-            last_bar = price_series[-1]
-            last_price = last_bar["price"]
-            last_ts = last_bar["ts"]
-            last_book = book_by_ts.get(last_ts, {"ts": last_ts, "bids": [], "asks": []})
-            exec_exit = _exit_exec_price(open_trade.signal.signal, last_book, last_price)
+        window = self._history_window
+
+        # Columns built once; each bar's history is then a slice of these
+        # rather than a rolling container copied on every on_step call.
+        timestamps = [bar["ts"] for bar in price_series]
+        prices = [bar["price"] for bar in price_series]
+        books = _align_books(timestamps, book_series)
+        price_arr = np.array(prices, dtype=np.float64)
+        price_arr.flags.writeable = False
+
+        # Strategies that opt in get zero-copy views into price_arr instead
+        # of a list slice, and struct-of-arrays books converted once per
+        # distinct snapshot (bars sharing a snapshot share it).
+        array_native = strategy.accepts_ndarray
+        snapshots: list[BookSnapshot] = []
+        if array_native:
+            converted: dict[int, BookSnapshot] = {}
+            for book in books:
+                snap = converted.get(id(book))
+                if snap is None:
+                    snap = converted[id(book)] = BookSnapshot.from_dict(book)
+                snapshots.append(snap)
+
+        # The strategy is only consulted while flat, so after each entry the
+        # loop jumps straight to the bar that closes the position.
+        n = len(prices)
+        i = max(window - 1, 0)
+        while i < n:
+            ts = timestamps[i]
+            price = prices[i]
+            book = books[i]
+            lo = i + 1 - window
+            signal = strategy.on_step(
+                timestamp=ts,
+                price=price,
+                book=snapshots[i] if array_native else book,
+                price_history=price_arr[lo : i + 1] if array_native else prices[lo : i + 1],
+                book_history=books[lo : i + 1],
+            )
+            if signal is None or signal.signal == Signal.HOLD:
+                i += 1
+                continue
+
+            exec_entry = _entry_exec_price(signal.signal, book, price)
+            logger.debug(
+                "Entry %s mid=%.4f exec=%.4f  conf=%.2f",
+                signal.signal.value,
+                price,
+                exec_entry,
+                signal.confidence,
+            )
+
+            exit_idx, reason = _find_exit(
+                price_arr, i, signal.signal == Signal.BUY,
+                stop_loss, take_profit, hold_periods,
+            )
+            exec_exit = _exit_exec_price(signal.signal, books[exit_idx], prices[exit_idx])
             trade = Trade(
-                signal=open_trade.signal,
-                entry_price=open_trade.entry_price,
+                signal=signal,
+                entry_price=exec_entry,
                 exit_price=exec_exit,
-                exit_timestamp=last_ts,
-                exit_reason="end_of_data",
+                exit_timestamp=timestamps[exit_idx],
+                exit_reason=_EXIT_REASONS[reason],
                 fee_rate=fee_rate,
             )
             result.trades.append(trade)
+            if reason == _END_OF_DATA:
+                break
+            logger.debug(
+                "Exit  %s mid=%.4f exec=%.4f  [%s]  pnl=%.4f",
+                signal.signal.value,
+                prices[exit_idx],
+                exec_exit,
+                trade.exit_reason,
+                trade.pnl,
+            )
+            # A new entry may be taken on the exit bar itself.
+            i = exit_idx
+
+        return result
+
+    def run_vectorized(
+        self,
+        strategy: BaseStrategy,
+        market_id: str,
+        token_label: str,
+        start_ts: Any,
+        end_ts: Any,
+        resolution: str = "1h",
+        *,
+        stop_loss: float = 0.05,
+        take_profit: float = 0.10,
+        hold_periods: int = 24,
+        position_size: float = 100.0,
+        fee_rate: float = 0.0,
+    ) -> BacktestResult:
+        """
+        :meth:`run` for strategies that can score a whole series at once.
+
+        The strategy must provide ``batch_signals(prices, books)`` returning
+        ``(signals, confidence)`` arrays (``+1`` BUY, ``-1`` SELL, ``0`` none),
+        as :class:`~polyautomate.analytics.strategies.rsi_mean_reversion.RSIMeanReversionStrategy`
+        does.  Position tracking then runs in a compiled kernel (when Numba is
+        installed) instead of calling ``on_step`` bar by bar.  Parameters and
+        trade semantics are those of :meth:`run`; signal metadata is empty.
+        """
+        series = self._vectorized_series(strategy, market_id, token_label, start_ts, end_ts, resolution)
+        return self._simulate_vectorized(
+            strategy, market_id, token_label, resolution, series,
+            stop_loss, take_profit, hold_periods, fee_rate,
+        )
+
+    def run_sweep(
+        self,
+        strategy: BaseStrategy,
+        market_id: str,
+        token_label: str,
+        start_ts: Any,
+        end_ts: Any,
+        resolution: str = "1h",
+        *,
+        stop_loss: Sequence[float] = (0.05,),
+        take_profit: Sequence[float] = (0.10,),
+        hold_periods: Sequence[int] = (24,),
+        position_size: float = 100.0,
+        fee_rate: float = 0.0,
+    ) -> list[tuple[dict[str, Any], BacktestResult]]:
+        """
+        :meth:`run_vectorized` over every combination of exit parameters.
+
+        Data is loaded and ``batch_signals`` evaluated once; each combination
+        then only re-runs the compiled position kernel, so the one-off JIT
+        and feature costs are amortised over the whole grid.  Returns
+        ``(params, result)`` pairs in grid order, where *params* holds that
+        combination's ``stop_loss``, ``take_profit`` and ``hold_periods``.
+        """
+        series = self._vectorized_series(strategy, market_id, token_label, start_ts, end_ts, resolution)
+        results = []
+        for sl, tp, hold in itertools.product(stop_loss, take_profit, hold_periods):
+            result = self._simulate_vectorized(
+                strategy, market_id, token_label, resolution, series, sl, tp, hold, fee_rate
+            )
+            results.append(({"stop_loss": sl, "take_profit": tp, "hold_periods": hold}, result))
+        return results
+
+    def _vectorized_series(
+        self,
+        strategy: BaseStrategy,
+        market_id: str,
+        token_label: str,
+        start_ts: Any,
+        end_ts: Any,
+        resolution: str,
+    ) -> tuple[list[int], np.ndarray, list[dict], np.ndarray, np.ndarray]:
+        """Load one series and score it: ``(timestamps, prices, books, signals, confidence)``."""
+        batch_signals = getattr(strategy, "batch_signals", None)
+        if batch_signals is None:
+            raise TypeError(f"{strategy.name} has no batch_signals(); use run() instead")
+
+        price_series, book_series = self._load_series(
+            market_id, token_label, start_ts, end_ts, resolution
+        )
+        timestamps = [bar["ts"] for bar in price_series]
+        prices = np.array([bar["price"] for bar in price_series], dtype=np.float64)
+        books = _align_books(timestamps, book_series)
+
+        signals, confidence = batch_signals(prices, books)
+        return timestamps, prices, books, np.asarray(signals, dtype=np.int8), confidence
+
+    def _simulate_vectorized(
+        self,
+        strategy: BaseStrategy,
+        market_id: str,
+        token_label: str,
+        resolution: str,
+        series: tuple[list[int], np.ndarray, list[dict], np.ndarray, np.ndarray],
+        stop_loss: float,
+        take_profit: float,
+        hold_periods: int,
+        fee_rate: float,
+    ) -> BacktestResult:
+        timestamps, prices, books, signals, confidence = series
+        entries, exits, reasons = _simulate_kernel(
+            prices,
+            signals,
+            self._history_window,
+            stop_loss,
+            take_profit,
+            hold_periods,
+        )
 
+        result = BacktestResult(
+            market_id=market_id,
+            token_label=token_label,
+            resolution=resolution,
+            strategy_name=strategy.name,
+            strategy_params=strategy.params,
+        )
+        for entry, exit_, reason in zip(entries.tolist(), exits.tolist(), reasons.tolist()):
+            direction = Signal.BUY if signals[entry] > 0 else Signal.SELL
+            entry_mid = float(prices[entry])
+            exit_mid = float(prices[exit_])
+            signal = TradeSignal(
+                timestamp=timestamps[entry],
+                market_id="",
+                token_label="",
+                signal=direction,
+                price_at_signal=entry_mid,
+                confidence=float(confidence[entry]),
+            )
+            result.trades.append(
+                Trade(
+                    signal=signal,
+                    entry_price=_entry_exec_price(direction, books[entry], entry_mid),
+                    exit_price=_exit_exec_price(direction, books[exit_], exit_mid),
+                    exit_timestamp=timestamps[exit_],
+                    exit_reason=_EXIT_REASONS[reason],
+                    fee_rate=fee_rate,
+                )
+            )
         return result
 
+    def run_batch(
+        self,
+        jobs: Sequence[BacktestJob],
+        *,
+        max_workers: int | None = None,
+    ) -> list[BacktestResult]:
+        """
+        Run independent backtests in parallel on a process pool.
+
+        Data for every distinct market window is fetched once in this process
+        (through the disk cache, which is therefore required), so the workers
+        replay from local files and never hit the API.  Results are returned
+        in the order of *jobs*.
+        """
+        if not self._cache_dir:
+            raise RuntimeError("run_batch requires cache_dir to be set")
+        windows = {(job.market_id, job.start_ts, job.end_ts, job.resolution) for job in jobs}
+        for market_id, start_ts, end_ts, resolution in windows:
+            self.prefetch_data(market_id, start_ts, end_ts, resolution, verbose=False)
+
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_batch_worker,
+            initargs=(self._history_window, self._cache_dir),
+        ) as pool:
+            return list(pool.map(_run_batch_job, jobs))
 
     def prefetch_data(
         self,
@@ -363,6 +564,42 @@ class BacktestEngine:
             print(f"done  ({n_bars:,} bars, {elapsed:.0f}s)")
         return True
 
+    def _load_series(
+        self,
+        market_id: str,
+        token_label: str,
+        start_ts: Any,
+        end_ts: Any,
+        resolution: str,
+    ) -> tuple[list[dict], list[dict]]:
+        """Return the price series and the book snapshots, both sorted by time."""
+        logger.info(
+            "Fetching data for %s [%s] %s → %s @ %s",
+            market_id,
+            token_label,
+            start_ts,
+            end_ts,
+            resolution,
+        )
+
+        prices_by_label, books_by_label = self._fetch_data(
+            market_id, start_ts, end_ts, resolution
+        )
+
+        raw_prices = prices_by_label.get(token_label, [])
+        raw_books = books_by_label.get(token_label, [])
+
+        if not raw_prices:
+            raise ValueError(
+                f"No price data for token label '{token_label}' in market '{market_id}'. "
+                f"Available labels: {list(prices_by_label.keys())}"
+            )
+
+        # Normalise and align by timestamp
+        price_series = _sort_by_ts(_extract_price_series(raw_prices))
+        book_series = _sort_by_ts(_extract_book_series(raw_books))
+        return price_series, book_series
+
     def _fetch_data(
         self,
         market_id: str,
@@ -391,6 +628,27 @@ class BacktestEngine:
 # Internal helpers
 # ------------------------------------------------------------------
 
+def _align_books(timestamps: list[int], book_series: list[dict]) -> list[dict]:
+    """
+    Book snapshot for each bar timestamp, by one merge-walk over both sorted
+    sequences.  Bars without a snapshot get an empty book stamped with the
+    bar's own timestamp; when several snapshots share a timestamp the last
+    one wins.
+    """
+    books: list[dict] = []
+    n_books = len(book_series)
+    j = 0
+    for ts in timestamps:
+        while j < n_books and book_series[j]["ts"] < ts:
+            j += 1
+        while j + 1 < n_books and book_series[j + 1]["ts"] == ts:
+            j += 1
+        if j < n_books and book_series[j]["ts"] == ts:
+            books.append(book_series[j])
+        else:
+            books.append({"ts": ts, "bids": [], "asks": []})
+    return books
+
 
 def _best_bid(book: dict) -> float | None:
     """Return the highest bid price from a book snapshot, or None if empty.
@@ -438,43 +696,91 @@ def _exit_exec_price(signal: Signal, book: dict, mid: float) -> float:
     return _best_ask(book) or mid
 
 
-class _OpenPosition:
-    __slots__ = ("signal", "entry_price", "entry_mid", "bars_held")
-
-    def __init__(
-        self,
-        signal: TradeSignal,
-        entry_price: float,
-        entry_mid: float,
-        bars_held: int,
-    ) -> None:
-        self.signal = signal
-        self.entry_price = entry_price  # actual execution price (ask or bid)
-        self.entry_mid = entry_mid      # mid-price at entry — used for exit triggers
-        self.bars_held = bars_held
+# Exit reasons by code, as returned by _find_exit and _simulate_kernel
+_EXIT_REASONS = ("take_profit", "stop_loss", "timeout", "end_of_data")
+_END_OF_DATA = 3
 
 
-def _check_exit(
-    pos: _OpenPosition,
-    current_price: float,
+def _find_exit(
+    prices: np.ndarray,
+    entry_idx: int,
+    is_buy: bool,
     stop_loss: float,
     take_profit: float,
     hold_periods: int,
-) -> str | None:
-    """Return the exit reason string if the position should be closed, else None.
+) -> tuple[int, int]:
+    """Return ``(exit_idx, reason_code)`` for a position opened at *entry_idx*.
 
-    Triggers are compared against the mid-price at entry (``pos.entry_mid``) so
-    that stop/take-profit levels are defined in clean probability-point terms,
+    Triggers are compared against the mid-price at entry so that
+    stop/take-profit levels are defined in clean probability-point terms,
     independent of the bid-ask spread captured in the execution prices.
+    Take-profit wins over stop-loss on the same bar, and both over the
+    timeout.  A position still open at the last bar closes there with
+    ``end_of_data``.
     """
-    is_buy = pos.signal.signal == Signal.BUY
-    price_move = current_price - pos.entry_mid
-    directional_move = price_move if is_buy else -price_move
-
-    if directional_move >= take_profit:
-        return "take_profit"
-    if directional_move <= -stop_loss:
-        return "stop_loss"
-    if pos.bars_held >= hold_periods:
-        return "timeout"
-    return None
+    horizon = max(hold_periods, 1)
+    moves = prices[entry_idx + 1 : entry_idx + horizon + 1] - prices[entry_idx]
+    if not is_buy:
+        moves = -moves
+    hit_tp = moves >= take_profit
+    hits = hit_tp | (moves <= -stop_loss)
+    if hits.any():
+        k = int(hits.argmax())
+        return entry_idx + 1 + k, 0 if hit_tp[k] else 1
+    if entry_idx + horizon < prices.shape[0]:
+        return entry_idx + horizon, 2
+    return prices.shape[0] - 1, _END_OF_DATA
+
+
+@njit(cache=True)
+def _simulate_kernel(
+    prices: np.ndarray,
+    signals: np.ndarray,
+    window: int,
+    stop_loss: float,
+    take_profit: float,
+    hold_periods: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Position state machine of :meth:`BacktestEngine.run` over precomputed
+    signals.  Returns ``(entry_idx, exit_idx, reason_code)`` per trade, with
+    reason codes indexing :data:`_EXIT_REASONS`.
+    """
+    n = prices.shape[0]
+    entries = np.empty(n, dtype=np.int64)
+    exits = np.empty(n, dtype=np.int64)
+    reasons = np.empty(n, dtype=np.int8)
+    n_trades = 0
+    open_idx = -1
+    direction = 0.0
+    entry_mid = 0.0
+    bars_held = 0
+    for i in range(n):
+        if open_idx >= 0:
+            move = (prices[i] - entry_mid) * direction
+            reason = -1
+            if move >= take_profit:
+                reason = 0
+            elif move <= -stop_loss:
+                reason = 1
+            elif bars_held >= hold_periods:
+                reason = 2
+            if reason >= 0:
+                entries[n_trades] = open_idx
+                exits[n_trades] = i
+                reasons[n_trades] = reason
+                n_trades += 1
+                open_idx = -1
+        if open_idx < 0 and i + 1 >= window and signals[i] != 0:
+            open_idx = i
+            direction = 1.0 if signals[i] > 0 else -1.0
+            entry_mid = prices[i]
+            bars_held = 0
+        if open_idx >= 0:
+            bars_held += 1
+    if open_idx >= 0:
+        entries[n_trades] = open_idx
+        exits[n_trades] = n - 1
+        reasons[n_trades] = 3
+        n_trades += 1
+    return entries[:n_trades], exits[:n_trades], reasons[:n_trades]
@@ -5,12 +5,21 @@ All functions operate on plain Python lists so they work directly with the
 ``price_history`` / ``book_history`` that :class:`BacktestEngine` passes to
 ``on_step()``.  Every function returns ``None`` when insufficient data is
 available rather than raising.
+
+:func:`compute_feature_matrix` is the batch counterpart of
+:func:`compute_features` (and :func:`rsi_series` / :func:`bollinger_z_series`
+of :func:`rsi` / :func:`bollinger`): it evaluates the same feature vector for every bar
+of a full series with NumPy, using ``NaN`` where the scalar version returns
+``None``.
 """
 
 from __future__ import annotations
 
 import math
-from typing import NamedTuple
+from typing import NamedTuple, Sequence
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
 
 # ── Price indicators ──────────────────────────────────────────────────────────
@@ -113,6 +122,9 @@ def trend_slope(prices: list[float], period: int = 24) -> float | None:
     enough history.  A positive value indicates an upward trend; negative
     indicates a downward trend.  The magnitude reflects how far the market has
     moved, making it easy to compare against an absolute threshold.
+
+    Only two elements are read, so this is O(1) per call and needs no
+    streaming counterpart.
     """
     if len(prices) < period + 1:
         return None
@@ -135,6 +147,181 @@ def realized_vol(prices: list[float], period: int = 24) -> float | None:
     return math.sqrt(var)
 
 
+# ── Streaming indicators ──────────────────────────────────────────────────────
+
+class RollingRSI:
+    """
+    O(1)-per-bar equivalent of :func:`rsi` for strategies called every bar.
+
+    Keeps running sums of the gains and losses over the last ``period`` price
+    changes.  :meth:`update` takes the caller's ``price_history``; when it
+    extends the previously seen window by exactly one bar the sums are
+    adjusted in place, otherwise (first call, skipped bars) the state is
+    re-seeded from the history.  The sums are also re-seeded every ``period``
+    updates to bound rounding drift, and the number of up/down moves in the
+    window is tracked so a window without losses (or gains) is detected
+    exactly rather than through a residual of the running sum.
+
+    The window is kept as a plain slice of the caller's list, so the per-bar
+    continuity check is a single C-level list comparison.
+    """
+
+    def __init__(self, period: int = 14) -> None:
+        self.period = period
+        self._window: list[float] = []
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._ups = 0
+        self._downs = 0
+        self._updates = 0
+
+    def _seed(self, prices: Sequence[float]) -> None:
+        self._window = prices[-(self.period + 1):]
+        self._gain_sum = 0.0
+        self._loss_sum = 0.0
+        self._ups = 0
+        self._downs = 0
+        prev = self._window[0]
+        for p in self._window[1:]:
+            delta = p - prev
+            if delta > 0:
+                self._gain_sum += delta
+                self._ups += 1
+            elif delta < 0:
+                self._loss_sum -= delta
+                self._downs += 1
+            prev = p
+        self._updates = 0
+
+    def _follows(self, prices: Sequence[float]) -> bool:
+        n = self.period + 1
+        return (
+            len(self._window) == n
+            and len(prices) > n
+            and self._window == prices[-n - 1:-1]
+        )
+
+    def update(self, prices: Sequence[float]) -> float | None:
+        """Return the RSI of ``prices`` (same value as ``rsi(prices, period)``)."""
+        if not isinstance(prices, list):
+            prices = list(prices)
+        if len(prices) < self.period + 1:
+            self._window = []
+            return None
+        if self._follows(prices) and self._updates + 1 < self.period:
+            window = self._window
+            evicted = window[1] - window[0]
+            if evicted > 0:
+                self._gain_sum -= evicted
+                self._ups -= 1
+            elif evicted < 0:
+                self._loss_sum += evicted
+                self._downs -= 1
+            price = prices[-1]
+            delta = price - window[-1]
+            if delta > 0:
+                self._gain_sum += delta
+                self._ups += 1
+            elif delta < 0:
+                self._loss_sum -= delta
+                self._downs += 1
+            self._window = prices[-self.period - 1:]
+            self._updates += 1
+        else:
+            self._seed(prices)
+        if self._downs == 0:
+            return 100.0
+        avg_gain = max(self._gain_sum, 0.0) / self.period if self._ups else 0.0
+        avg_loss = max(self._loss_sum, 0.0) / self.period
+        if avg_loss == 0:
+            return 100.0
+        return 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+
+
+class RollingBollinger:
+    """
+    O(1)-per-bar equivalent of :func:`bollinger` for strategies called every bar.
+
+    Keeps running sums of the last ``period`` prices (relative to a shift so
+    the squares stay small), re-seeding from the history on the first call,
+    after skipped bars, and every ``period`` updates to bound rounding drift.
+    A window of identical prices is detected exactly and reported with
+    ``z == 0``, as :func:`bollinger` does for a zero std.
+    """
+
+    def __init__(self, period: int = 20, n_std: float = 2.0) -> None:
+        self.period = period
+        self.n_std = n_std
+        self._window: list[float] = []
+        self._shift = 0.0
+        self._s1 = 0.0
+        self._s2 = 0.0
+        self._flat_run = 0  # number of trailing equal prices, capped at period
+        self._updates = 0
+
+    def _seed(self, prices: Sequence[float]) -> None:
+        self._window = prices[-self.period:]
+        last = self._window[-1]
+        self._shift = last
+        self._s1 = 0.0
+        self._s2 = 0.0
+        self._flat_run = 0
+        for p in reversed(self._window):
+            if p != last:
+                break
+            self._flat_run += 1
+        for p in self._window:
+            d = p - last
+            self._s1 += d
+            self._s2 += d * d
+        self._updates = 0
+
+    def _follows(self, prices: Sequence[float]) -> bool:
+        n = self.period
+        return (
+            len(self._window) == n
+            and len(prices) > n
+            and self._window == prices[-n - 1:-1]
+        )
+
+    def update(self, prices: Sequence[float]) -> BollingerBands | None:
+        """Return the bands of ``prices`` (same as ``bollinger(prices, period, n_std)``)."""
+        if not isinstance(prices, list):
+            prices = list(prices)
+        if len(prices) < self.period:
+            self._window = []
+            return None
+        if self._follows(prices) and self._updates + 1 < self.period:
+            window = self._window
+            price = prices[-1]
+            d = window[0] - self._shift
+            self._s1 -= d
+            self._s2 -= d * d
+            d = price - self._shift
+            self._s1 += d
+            self._s2 += d * d
+            self._flat_run = min(self._flat_run + 1, self.period) if price == window[-1] else 1
+            self._window = prices[-self.period:]
+            self._updates += 1
+        else:
+            self._seed(prices)
+
+        if self._flat_run >= self.period:
+            mid = self._window[-1]
+            return BollingerBands(mid, mid, mid, 0.0)
+        mean_d = self._s1 / self.period
+        mid = self._shift + mean_d
+        std = math.sqrt(max(self._s2 / self.period - mean_d * mean_d, 0.0))
+        if std == 0.0:
+            return BollingerBands(mid, mid, mid, 0.0)
+        return BollingerBands(
+            upper=mid + self.n_std * std,
+            mid=mid,
+            lower=mid - self.n_std * std,
+            z=(prices[-1] - mid) / std,
+        )
+
+
 # ── Order book indicators ─────────────────────────────────────────────────────
 
 def book_spread(book: dict) -> float | None:
@@ -205,15 +392,160 @@ def compute_features(
     Returns a list aligned with :data:`FEATURE_NAMES`.  Individual entries
     may be ``None`` when insufficient history is available.
     """
+    # Positional access on the NamedTuple results: [3] is bb.z, [2] is
+    # mc.histogram.
     bb = bollinger(price_history, bb_period)
     mc = macd(price_history, macd_fast, macd_slow, macd_signal)
     return [
         rsi(price_history, rsi_period),
-        bb.z if bb else None,
-        mc.histogram if mc else None,
+        bb[3] if bb else None,
+        mc[2] if mc else None,
         momentum(price_history, mom_period),
         realized_vol(price_history, vol_period),
         book_imbalance(book),
         book_pressure(book, book_depth),
         book_spread(book),
     ]
+
+
+def _trailing_windows(values: np.ndarray, period: int, n_bars: int) -> np.ndarray:
+    """
+    ``(n_bars, period)`` view whose row *i* holds the ``period`` values ending
+    at bar *i*.  Rows without enough data are filled with ``NaN``.
+    """
+    out = np.full((n_bars, period), np.nan)
+    if len(values) >= period:
+        win = sliding_window_view(values, period)
+        out[n_bars - len(win):] = win
+    return out
+
+
+def rsi_series(prices: Sequence[float] | np.ndarray, period: int = 14) -> np.ndarray:
+    """
+    :func:`rsi` evaluated at every bar of a series (``NaN`` while fewer than
+    ``period + 1`` prices are available).
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    n = len(p)
+    out = np.full(n, np.nan)
+    if n < period + 1:
+        return out
+    delta = np.diff(p)
+    gains = _trailing_windows(np.where(delta > 0, delta, 0.0), period, n - 1)
+    losses = _trailing_windows(np.where(delta > 0, 0.0, -delta), period, n - 1)
+    avg_gain = gains.sum(axis=1) / period
+    avg_loss = losses.sum(axis=1) / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[1:] = np.where(avg_loss == 0, 100.0, 100.0 - 100.0 / (1.0 + avg_gain / avg_loss))
+    return out
+
+
+def bollinger_z_series(prices: Sequence[float] | np.ndarray, period: int = 20) -> np.ndarray:
+    """
+    :func:`bollinger` ``z`` evaluated at every bar of a series (``NaN`` while
+    fewer than ``period`` prices are available).
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    n = len(p)
+    win = _trailing_windows(p, period, n)
+    mid = win.mean(axis=1)
+    std = win.std(axis=1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(std == 0.0, 0.0, (p - mid) / std)
+
+
+def compute_feature_matrix(
+    prices: Sequence[float] | np.ndarray,
+    books: Sequence[dict],
+    *,
+    window: int = 48,
+    rsi_period: int = 14,
+    bb_period: int = 20,
+    macd_fast: int = 12,
+    macd_slow: int = 26,
+    macd_signal: int = 9,
+    mom_period: int = 10,
+    vol_period: int = 24,
+    book_depth: int = 5,
+) -> np.ndarray:
+    """
+    Batch :func:`compute_features` over a whole bar-aligned series.
+
+    Row *i* equals ``compute_features(prices[i-window+1:i+1], books[i], ...)``
+    — i.e. what a strategy sees when :class:`BacktestEngine` replays the series
+    with ``history_window=window`` — with ``None`` mapped to ``NaN``.  Rows
+    for the first ``window - 1`` bars (which the engine never evaluates) are
+    all ``NaN``.
+
+    Returns an ``(len(prices), len(FEATURE_NAMES))`` float64 array.
+    """
+    p = np.asarray(prices, dtype=np.float64)
+    n = len(p)
+    out = np.full((n, len(FEATURE_NAMES)), np.nan)
+    if n < window:
+        return out
+    rows = slice(window - 1, n)
+
+    # RSI: simple averages of gains / losses over the last rsi_period changes
+    if window >= rsi_period + 1:
+        out[rows, 0] = rsi_series(p, rsi_period)[rows]
+
+    # Bollinger z-score (population std over bb_period)
+    if window >= bb_period:
+        out[rows, 1] = bollinger_z_series(p, bb_period)[rows]
+
+    # MACD histogram: EMAs are seeded at the first bar of each engine window,
+    # so run the recurrences column-by-column over all windows at once.
+    if window >= macd_slow + macd_signal:
+        win = sliding_window_view(p, window)
+        kf = 2.0 / (macd_fast + 1)
+        ks = 2.0 / (macd_slow + 1)
+        kg = 2.0 / (macd_signal + 1)
+        ema_f = win[:, 0]
+        ema_s = win[:, 0]
+        macd_line = sig = ema_f - ema_s
+        for j in range(window):
+            if j:
+                col = win[:, j]
+                ema_f = col * kf + ema_f * (1.0 - kf)
+                ema_s = col * ks + ema_s * (1.0 - ks)
+            if j == macd_slow - 1:
+                macd_line = sig = ema_f - ema_s
+            elif j >= macd_slow:
+                macd_line = ema_f - ema_s
+                sig = macd_line * kg + sig * (1.0 - kg)
+        out[rows, 2] = macd_line - sig
+
+    # Momentum (rate of change)
+    if window >= mom_period + 1:
+        base = np.full(n, np.nan)
+        base[mom_period:] = p[:-mom_period]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mom = np.where(base == 0.0, np.nan, (p - base) / base)
+        out[rows, 3] = mom[rows]
+
+    # Realised vol: sample std of the valid log-returns in the last vol_period
+    if window >= vol_period + 1:
+        prev, cur = p[:-1], p[1:]
+        valid = (prev > 0.0) & (cur > 0.0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_ret = np.where(valid, np.log(np.where(valid, cur / prev, 1.0)), np.nan)
+        lr_win = _trailing_windows(log_ret, vol_period, n - 1)
+        counts = (~np.isnan(lr_win)).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.nansum(lr_win, axis=1) / counts
+            var = np.nansum((lr_win - mean[:, None]) ** 2, axis=1) / (counts - 1)
+        vol_full = np.full(n, np.nan)
+        vol_full[1:] = np.where(counts >= 2, np.sqrt(var), np.nan)
+        out[rows, 4] = vol_full[rows]
+
+    # Order book features only depend on the current snapshot
+    for i in range(window - 1, n):
+        book = books[i]
+        out[i, 5] = book_imbalance(book)
+        out[i, 6] = book_pressure(book, book_depth)
+        spread = book_spread(book)
+        out[i, 7] = np.nan if spread is None else spread
+
+    return out
+
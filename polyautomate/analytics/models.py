@@ -6,7 +6,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import Any, NamedTuple
+
+import numpy as np
 
 from .stats import ConfidenceInterval, wilson_ci
 
@@ -19,6 +21,49 @@ class Signal(str, Enum):
     HOLD = "hold"  # No action.
 
 
+_NO_LEVELS = np.empty(0, dtype=np.float64)
+_NO_LEVELS.flags.writeable = False
+
+
+def _levels_columns(levels: Any) -> tuple[np.ndarray, np.ndarray]:
+    if len(levels) == 0:
+        return _NO_LEVELS, _NO_LEVELS
+    # (n, 2) -> contiguous (2, n); each row unpacks as one contiguous column.
+    prices, sizes = np.array(levels, dtype=np.float64).T.copy()
+    return prices, sizes
+
+
+class BookSnapshot(NamedTuple):
+    """
+    Order book for one bar in struct-of-arrays layout: each side is split
+    into parallel contiguous float64 ``prices`` / ``sizes`` arrays, so
+    depth-weighted metrics are plain vector ops (e.g.
+    ``np.dot(book.bid_prices, book.bid_sizes)``).
+
+    Built once per distinct snapshot by
+    :class:`~polyautomate.analytics.engine.BacktestEngine` for strategies
+    that set ``accepts_ndarray``.
+    """
+
+    ts: int
+    bid_prices: np.ndarray
+    bid_sizes: np.ndarray
+    ask_prices: np.ndarray
+    ask_sizes: np.ndarray
+
+    @classmethod
+    def from_dict(cls, book: dict) -> "BookSnapshot":
+        bid_prices, bid_sizes = _levels_columns(book.get("bids", ()))
+        ask_prices, ask_sizes = _levels_columns(book.get("asks", ()))
+        return cls(
+            ts=int(book.get("ts", 0)),
+            bid_prices=bid_prices,
+            bid_sizes=bid_sizes,
+            ask_prices=ask_prices,
+            ask_sizes=ask_sizes,
+        )
+
+
 @dataclass
 class TradeSignal:
     """A signal emitted by a strategy at a specific point in time."""
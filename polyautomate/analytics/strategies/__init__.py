@@ -6,6 +6,7 @@ from .whale_watcher import WhaleWatcherStrategy
 from .rsi_mean_reversion import RSIMeanReversionStrategy
 from .macd_momentum import MACDMomentumStrategy
 from .optimal_entry import EntryProfile, ProfileStrategy, scan_optimal_entries
+from .batch import run_profile_scan_batch
 
 __all__ = [
     "WhaleWatcherStrategy",
@@ -14,4 +15,5 @@ __all__ = [
     "EntryProfile",
     "ProfileStrategy",
     "scan_optimal_entries",
+    "run_profile_scan_batch",
 ]
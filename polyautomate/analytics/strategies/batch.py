@@ -0,0 +1,86 @@
+"""
+Parallel parameter sweeps over :func:`scan_optimal_entries`.
+
+Each (parameter combination) scan is independent and CPU-bound, so the grid
+is fanned out over a process pool.  The price/book series are shipped to each
+worker once via the pool initializer rather than with every task.
+"""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Mapping, Sequence
+
+from ..models import Signal
+from .optimal_entry import EntryProfile, scan_optimal_entries
+
+# Per-worker copy of the series being scanned (set by ``_init_worker``).
+_WORKER_DATA: tuple[list[dict], list[dict], Signal] | None = None
+
+
+def _init_worker(price_series: list[dict], book_series: list[dict], signal: Signal) -> None:
+    global _WORKER_DATA
+    _WORKER_DATA = (price_series, book_series, signal)
+
+
+def _scan_one(params: dict[str, Any]) -> EntryProfile | None:
+    assert _WORKER_DATA is not None
+    price_series, book_series, signal = _WORKER_DATA
+    try:
+        return scan_optimal_entries(price_series, book_series, signal, **params)
+    except ValueError:
+        # No qualifying entries for this combination.
+        return None
+
+
+def _expand_grid(param_grid: Mapping[str, Sequence[Any]]) -> list[dict[str, Any]]:
+    keys = list(param_grid)
+    return [dict(zip(keys, values)) for values in itertools.product(*(param_grid[k] for k in keys))]
+
+
+def run_profile_scan_batch(
+    price_series: list[dict],
+    book_series: list[dict],
+    signal: Signal,
+    param_grid: Mapping[str, Sequence[Any]],
+    *,
+    max_workers: int | None = None,
+    score: Callable[[EntryProfile], float] | None = None,
+) -> list[tuple[dict[str, Any], EntryProfile]]:
+    """
+    Run :func:`scan_optimal_entries` for every combination in *param_grid*.
+
+    Parameters
+    ----------
+    price_series, book_series, signal:
+        Passed unchanged to :func:`scan_optimal_entries`.
+    param_grid:
+        Mapping of keyword argument name to candidate values, e.g.
+        ``{"min_gain": [0.03, 0.05], "forward_window": [12, 24]}``.
+    max_workers:
+        Process pool size (defaults to the number of CPUs).
+    score:
+        Ranking key for the results, highest first.  Defaults to
+        ``profile.n_samples``.
+
+    Returns
+    -------
+    ``(params, profile)`` pairs sorted by *score*.  Combinations that found
+    no optimal entries are omitted.
+    """
+    configs = _expand_grid(param_grid)
+    if not configs:
+        return []
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(price_series, book_series, signal),
+    ) as pool:
+        profiles = list(pool.map(_scan_one, configs))
+
+    results = [(params, prof) for params, prof in zip(configs, profiles) if prof is not None]
+    key = score or (lambda prof: prof.n_samples)
+    results.sort(key=lambda pair: key(pair[1]), reverse=True)
+    return results
@@ -179,7 +179,7 @@ class MACDMomentumStrategy(BaseStrategy):
         if mc is None:
             return None
 
-        hist = mc.histogram
+        macd_line, signal_line, hist = mc
         prev = self._prev_histogram
         self._prev_histogram = hist
 
@@ -198,6 +198,9 @@ class MACDMomentumStrategy(BaseStrategy):
         if abs(hist) < self.min_histogram:
             return None
 
+        # Confirmation filters run cheapest-first and return early: trend and
+        # momentum read two prices each, book pressure sorts both book sides.
+
         # ---- Optional trend filter ----
         # Suppress crossovers that fire against a strong prevailing trend.
         # A bearish crossover (sell) during a strong uptrend is usually a
@@ -232,25 +235,22 @@ class MACDMomentumStrategy(BaseStrategy):
 
         # ---- Emit signal ----
         # Confidence: normalise histogram magnitude by the swing from prev to
-        # current.  Larger swings → higher confidence.
-        swing = abs(hist - prev)
-        confidence = min(1.0, swing / 0.01) if swing > 0 else 0.5
-
-        if bullish_cross:
-            signal = Signal.BUY
-        else:
-            signal = Signal.SELL
+        # current.  Larger swings → higher confidence.  A crossover always has
+        # a non-zero swing (one side is strictly signed), so no fallback.
+        confidence = min(1.0, abs(hist - prev) * 100.0)
+        signal = Signal.BUY if bullish_cross else Signal.SELL
 
+        # Raw floats; round when displaying.
         metadata: dict[str, Any] = {
-            "macd": round(mc.macd, 5),
-            "signal_line": round(mc.signal, 5),
-            "histogram": round(hist, 5),
-            "prev_histogram": round(prev, 5),
+            "macd": macd_line,
+            "signal_line": signal_line,
+            "histogram": hist,
+            "prev_histogram": prev,
         }
         if mom is not None:
-            metadata["momentum"] = round(mom, 4)
+            metadata["momentum"] = mom
         if bp is not None:
-            metadata["book_pressure"] = round(bp, 3)
+            metadata["book_pressure"] = bp
 
         return TradeSignal(
             timestamp=timestamp,
@@ -25,16 +25,43 @@ from __future__ import annotations
 
 import math
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
-from ..indicators import FEATURE_NAMES, compute_features
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from .._njit import HAVE_NUMBA, njit
+from ..indicators import FEATURE_NAMES, compute_feature_matrix, compute_features
 from ..models import Signal, TradeSignal
 from ..strategy import BaseStrategy
 
 
+# ── Distance kernel ───────────────────────────────────────────────────────────
+
+def _distance_loop(feats, mean, inv_std, valid):
+    total = 0.0
+    count = 0
+    for i in range(feats.shape[0]):
+        x = feats[i]
+        if valid[i] and not math.isnan(x):
+            d = (x - mean[i]) * inv_std[i]
+            total += d * d
+            count += 1
+    if count == 0:
+        return math.inf
+    return math.sqrt(total / count)
+
+
+# Compiled when numba is installed; ``None`` otherwise so :meth:`distance`
+# uses its NumPy path.  No ``fastmath``: it would let LLVM assume NaN never
+# occurs and drop the missing-feature check.
+_distance_kernel = njit(cache=True)(_distance_loop) if HAVE_NUMBA else None
+
+
 # ── Learned profile ───────────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(eq=False)
 class EntryProfile:
     """
     Statistical fingerprint of optimal entry conditions.
@@ -46,37 +73,117 @@ class EntryProfile:
     feature_names:
         Ordered list of feature names (mirrors :data:`~indicators.FEATURE_NAMES`).
     mean:
-        Per-feature mean at optimal entry bars.
+        Per-feature mean at optimal entry bars (float64 array; lists are
+        accepted and converted).
     std:
-        Per-feature sample std-dev at optimal entry bars.
+        Per-feature sample std-dev at optimal entry bars (float64 array).
     n_samples:
         Number of optimal entry bars used to build the profile.
     training_market:
         Human-readable label for the market this was trained on.
+    fp32:
+        Run :meth:`distance` / :meth:`distances` in float32.  Halves the
+        working set when scoring many profiles; indicator features carry
+        only a few significant digits so the loss of precision is harmless.
     """
 
     signal: Signal
     feature_names: list[str]
-    mean: list[float]
-    std: list[float]
+    mean: np.ndarray
+    std: np.ndarray
     n_samples: int
     training_market: str = ""
+    fp32: bool = False
+
+    # Derived from mean/std and used by :meth:`distance`, built once per
+    # profile in the working precision selected by ``fp32``.
+    _dtype: type = field(init=False, repr=False)
+    _mean_k: np.ndarray = field(init=False, repr=False)
+    _inv_std_k: np.ndarray = field(init=False, repr=False)
+    _valid: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.mean = np.ascontiguousarray(self.mean, dtype=np.float64)
+        self.std = np.ascontiguousarray(self.std, dtype=np.float64)
+        self._valid = self.std != 0.0
+        inv_std = np.divide(1.0, self.std, out=np.zeros_like(self.std), where=self._valid)
+        self._dtype = np.float32 if self.fp32 else np.float64
+        self._mean_k = self.mean.astype(self._dtype)
+        self._inv_std_k = inv_std.astype(self._dtype)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, EntryProfile):
+            return NotImplemented
+        return (
+            self.signal == other.signal
+            and self.feature_names == other.feature_names
+            and self.n_samples == other.n_samples
+            and self.training_market == other.training_market
+            and np.array_equal(self.mean, other.mean)
+            and np.array_equal(self.std, other.std)
+        )
+
+    # ── Persistence ──────────────────────────────────────────────────────────
+
+    def to_npz(self, path: str | Path) -> None:
+        """Write the profile to a compressed ``.npz`` archive."""
+        np.savez_compressed(
+            path,
+            signal=np.array(self.signal.value),
+            feature_names=np.array(self.feature_names),
+            mean=self.mean,
+            std=self.std,
+            n_samples=np.array(self.n_samples),
+            training_market=np.array(self.training_market),
+            fp32=np.array(self.fp32),
+        )
 
-    def distance(self, features: list[float | None]) -> float:
+    @classmethod
+    def from_npz(cls, path: str | Path) -> "EntryProfile":
+        """Load a profile written by :meth:`to_npz`."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                signal=Signal(str(data["signal"])),
+                feature_names=data["feature_names"].tolist(),
+                mean=data["mean"],
+                std=data["std"],
+                n_samples=int(data["n_samples"]),
+                training_market=str(data["training_market"]),
+                fp32=bool(data["fp32"]),
+            )
+
+    def distances(self, feature_matrix: np.ndarray) -> np.ndarray:
+        """
+        Row-wise :meth:`distance` for an ``(n_bars, n_features)`` matrix with
+        ``NaN`` marking missing features.
+        """
+        feature_matrix = np.asarray(feature_matrix, dtype=self._dtype)
+        valid = ~np.isnan(feature_matrix) & self._valid
+        z = (feature_matrix - self._mean_k) * self._inv_std_k
+        count = valid.sum(axis=1, dtype=self._dtype)
+        total = np.where(valid, z * z, 0.0).sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(count > 0, np.sqrt(total / count), np.inf)
+
+    def distance(self, features: list[float | None] | np.ndarray) -> float:
         """
         Standardised Euclidean distance from this profile.
 
-        Features with ``None`` value or zero std are skipped.
+        Features with ``None`` (or NaN) value or zero std are skipped.
         Returns ``inf`` when no valid features remain.
         """
-        total = 0.0
-        count = 0
-        for x, mu, sigma in zip(features, self.mean, self.std):
-            if x is None or sigma == 0.0:
-                continue
-            total += ((x - mu) / sigma) ** 2
-            count += 1
-        return math.sqrt(total / count) if count > 0 else float("inf")
+        feats = np.asarray(features, dtype=self._dtype)
+        if _distance_kernel is not None:
+            return _distance_kernel(
+                np.ascontiguousarray(feats), self._mean_k, self._inv_std_k, self._valid
+            )
+        mask = self._valid & ~np.isnan(feats)
+        count = int(mask.sum())
+        if count == 0:
+            return float("inf")
+        z = (feats - self._mean_k) * self._inv_std_k
+        total = float(np.where(mask, z * z, 0.0).sum())
+        return math.sqrt(total / count)
 
     def summary(self) -> str:
         lines = [
@@ -86,7 +193,7 @@ class EntryProfile:
             f"{'Feature':<18}  {'Mean':>8}  {'Std':>8}",
             "-" * 38,
         ]
-        for name, mu, sigma in zip(self.feature_names, self.mean, self.std):
+        for name, mu, sigma in zip(self.feature_names, self.mean.tolist(), self.std.tolist()):
             lines.append(f"{name:<18}  {mu:>8.4f}  {sigma:>8.4f}")
         return "\n".join(lines)
 
@@ -140,26 +247,37 @@ def scan_optimal_entries(
     if signal not in (Signal.BUY, Signal.SELL):
         raise ValueError("signal must be Signal.BUY or Signal.SELL")
 
-    prices = [b["price"] for b in price_series]
-    book_by_ts = {snap["ts"]: snap for snap in book_series}
-
-    feature_matrix: list[list[float | None]] = []
-
-    for i in range(indicator_window, len(prices) - forward_window):
-        entry_price = prices[i]
-        future_prices = prices[i + 1 : i + 1 + forward_window]
+    n_bars = len(price_series)
+    prices = np.fromiter((b["price"] for b in price_series), dtype=np.float64, count=n_bars)
+    ts_arr = np.fromiter((b["ts"] for b in price_series), dtype=np.int64, count=n_bars)
+    # Book snapshots usually share the price timestamps one-to-one; index
+    # them positionally then and only fall back to a ts lookup otherwise.
+    aligned = len(book_series) == n_bars and all(
+        p["ts"] == b["ts"] for p, b in zip(price_series, book_series)
+    )
+    book_by_ts = None if aligned else {snap["ts"]: snap for snap in book_series}
 
+    # Row i of ``future`` holds prices[i+1 : i+1+forward_window]
+    last = n_bars - forward_window
+    if forward_window > 0 and last > indicator_window:
+        future = sliding_window_view(prices[1:], forward_window)
         if signal == Signal.BUY:
-            triggered = any(p >= entry_price + min_gain for p in future_prices)
+            triggered = future.max(axis=1) >= prices[:last] + min_gain
         else:
-            triggered = any(p <= entry_price - min_gain for p in future_prices)
-
-        if not triggered:
-            continue
+            triggered = future.min(axis=1) <= prices[:last] - min_gain
+        triggered[:indicator_window] = False
+        hit_idx = np.flatnonzero(triggered)
+    else:
+        hit_idx = np.empty(0, dtype=np.intp)
 
-        ts = price_series[i]["ts"]
-        book = book_by_ts.get(ts, {"ts": ts, "bids": [], "asks": []})
-        price_hist = prices[max(0, i - indicator_window) : i + 1]
+    feature_matrix: list[list[float | None]] = []
+    for i in hit_idx:
+        if book_by_ts is None:
+            book = book_series[i]
+        else:
+            ts = int(ts_arr[i])
+            book = book_by_ts.get(ts, {"ts": ts, "bids": [], "asks": []})
+        price_hist = prices[max(0, i - indicator_window) : i + 1].tolist()
 
         feats = compute_features(
             price_hist,
@@ -182,24 +300,16 @@ def scan_optimal_entries(
         )
 
     n = len(feature_matrix)
-    n_feats = len(FEATURE_NAMES)
-
-    # Per-column mean, ignoring None
-    means: list[float] = []
-    stds: list[float] = []
-    for col in range(n_feats):
-        vals = [row[col] for row in feature_matrix if row[col] is not None]
-        if not vals:
-            means.append(0.0)
-            stds.append(0.0)
-            continue
-        mu = sum(vals) / len(vals)
-        means.append(mu)
-        if len(vals) < 2:
-            stds.append(0.0)
-        else:
-            var = sum((v - mu) ** 2 for v in vals) / (len(vals) - 1)
-            stds.append(math.sqrt(var))
+
+    # Per-column mean / sample std, ignoring None (NaN)
+    matrix = np.asarray(feature_matrix, dtype=np.float64)
+    present = ~np.isnan(matrix)
+    counts = present.sum(axis=0)
+    filled = np.where(present, matrix, 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        means = np.where(counts > 0, filled.sum(axis=0) / counts, 0.0)
+        sq_dev = np.where(present, (matrix - means) ** 2, 0.0).sum(axis=0)
+        stds = np.where(counts >= 2, np.sqrt(sq_dev / (counts - 1)), 0.0)
 
     return EntryProfile(
         signal=signal,
@@ -262,6 +372,9 @@ class ProfileStrategy(BaseStrategy):
             vol_period=vol_period,
             book_depth=book_depth,
         )
+        # ts -> (book, price, distance), filled by precompute_distances()
+        self._precomputed: dict[int, tuple[dict, float, float]] | None = None
+        self._precomputed_window = 0
 
     @property
     def name(self) -> str:
@@ -278,6 +391,40 @@ class ProfileStrategy(BaseStrategy):
             **self._indicator_kwargs,
         }
 
+    def precompute_distances(
+        self,
+        prices: list[float] | np.ndarray,
+        books: list[dict],
+        *,
+        window: int = 48,
+    ) -> np.ndarray:
+        """
+        Batch-compute the profile distance for every bar of a series.
+
+        ``prices`` and ``books`` must be the bar-aligned series the engine will
+        replay (each book carrying its bar ``ts``) and ``window`` must match the
+        engine's ``history_window``.  Bars the engine never evaluates get
+        ``inf``.
+
+        The distances are kept on the strategy so subsequent :meth:`on_step`
+        calls look them up by timestamp instead of recomputing indicators.
+        A stored distance is only used when the call passes the same book
+        object, the same price and a ``window``-long history, so replaying a
+        different series (or window) recomputes rather than reusing stale
+        values.  They are computed in float32 when the profile has
+        ``fp32=True``.
+        """
+        matrix = compute_feature_matrix(prices, books, window=window, **self._indicator_kwargs)
+        dist = self._profile.distances(matrix)
+        dist[: window - 1] = np.inf
+        self._precomputed = {
+            book["ts"]: (book, float(p), float(d))
+            for book, p, d in zip(books, prices, dist)
+            if "ts" in book
+        }
+        self._precomputed_window = window
+        return dist
+
     def on_step(
         self,
         timestamp: int,
@@ -286,8 +433,17 @@ class ProfileStrategy(BaseStrategy):
         price_history: list[float],
         book_history: list[dict],
     ) -> TradeSignal | None:
-        feats = compute_features(price_history, book, **self._indicator_kwargs)
-        dist = self._profile.distance(feats)
+        dist = None
+        if self._precomputed is not None and len(price_history) == self._precomputed_window:
+            entry = self._precomputed.get(timestamp)
+            if entry is not None and entry[0] is book and entry[1] == price:
+                dist = entry[2]
+        if dist is None:
+            feats = np.asarray(
+                compute_features(price_history, book, **self._indicator_kwargs),
+                dtype=np.float64,
+            )
+            dist = self._profile.distance(feats)
 
         if dist > self._max_distance:
             return None
@@ -56,9 +56,18 @@ Optional filters
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Sequence
 
-from ..indicators import bollinger, book_pressure, rsi, trend_slope
+import numpy as np
+
+from ..indicators import (
+    RollingBollinger,
+    RollingRSI,
+    bollinger_z_series,
+    book_pressure,
+    rsi_series,
+    trend_slope,
+)
 from ..models import Signal, TradeSignal
 from ..strategy import BaseStrategy
 
@@ -104,6 +113,26 @@ class RSIMeanReversionStrategy(BaseStrategy):
         bars to consider the trend "strong".  Default 0.05 (5 pp).
     """
 
+    __slots__ = (
+        "_rsi_period",
+        "_oversold_threshold",
+        "_overbought_threshold",
+        "bb_confirm",
+        "_bb_period",
+        "bb_z_min",
+        "book_pressure_confirm",
+        "book_depth",
+        "min_price",
+        "max_price",
+        "trend_filter",
+        "trend_lookback",
+        "trend_threshold",
+        "_rsi",
+        "_bb",
+        "_inv_oversold",
+        "_inv_overbought",
+    )
+
     def __init__(
         self,
         *,
@@ -135,6 +164,47 @@ class RSIMeanReversionStrategy(BaseStrategy):
         self.trend_lookback = trend_lookback
         self.trend_threshold = trend_threshold
 
+    # Periods and thresholds are properties so the state derived from them
+    # (the O(1)-per-bar running RSI / Bollinger sums and the confidence scale
+    # factors) stays in step when they are changed between runs.  A threshold
+    # of 0 / 100 can never fire, so its factor is unused.
+
+    @property
+    def rsi_period(self) -> int:
+        return self._rsi_period
+
+    @rsi_period.setter
+    def rsi_period(self, value: int) -> None:
+        self._rsi_period = value
+        self._rsi = RollingRSI(value)
+
+    @property
+    def bb_period(self) -> int:
+        return self._bb_period
+
+    @bb_period.setter
+    def bb_period(self, value: int) -> None:
+        self._bb_period = value
+        self._bb = RollingBollinger(value)
+
+    @property
+    def oversold_threshold(self) -> float:
+        return self._oversold_threshold
+
+    @oversold_threshold.setter
+    def oversold_threshold(self, value: float) -> None:
+        self._oversold_threshold = value
+        self._inv_oversold = 1.0 / value if value else 0.0
+
+    @property
+    def overbought_threshold(self) -> float:
+        return self._overbought_threshold
+
+    @overbought_threshold.setter
+    def overbought_threshold(self, value: float) -> None:
+        self._overbought_threshold = value
+        self._inv_overbought = 1.0 / (100.0 - value) if value != 100.0 else 0.0
+
     # ------------------------------------------------------------------
     # BaseStrategy interface
     # ------------------------------------------------------------------
@@ -174,16 +244,22 @@ class RSIMeanReversionStrategy(BaseStrategy):
         if price < self.min_price or price > self.max_price:
             return None
 
-        rsi_val = rsi(price_history, self.rsi_period)
+        rsi_val = self._rsi.update(price_history)
         if rsi_val is None:
             return None
 
-        is_oversold = rsi_val < self.oversold_threshold
-        is_overbought = rsi_val > self.overbought_threshold
+        oversold = self.oversold_threshold
+        overbought = self.overbought_threshold
+        is_oversold = rsi_val < oversold
+        is_overbought = rsi_val > overbought
 
         if not is_oversold and not is_overbought:
             return None
 
+        # Confirmation filters run cheapest-first and return early: the trend
+        # reads two prices, Bollinger scans bb_period bars, book pressure sorts
+        # both book sides.
+
         # ---- Optional trend filter ----
         # Suppress mean-reversion signals that trade against a strong trend.
         # RSI goes overbought/oversold both in genuine reversions AND during
@@ -200,13 +276,14 @@ class RSIMeanReversionStrategy(BaseStrategy):
         # ---- Optional Bollinger Band confirmation ----
         bb_z: float | None = None
         if self.bb_confirm:
-            bb = bollinger(price_history, self.bb_period)
+            bb = self._bb.update(price_history)
             if bb is None:
                 return None
-            bb_z = bb.z
-            if is_oversold and bb_z > -self.bb_z_min:
+            _, _, _, bb_z = bb
+            bb_z_min = self.bb_z_min
+            if is_oversold and bb_z > -bb_z_min:
                 return None
-            if is_overbought and bb_z < self.bb_z_min:
+            if is_overbought and bb_z < bb_z_min:
                 return None
 
         # ---- Optional book pressure confirmation ----
@@ -224,16 +301,19 @@ class RSIMeanReversionStrategy(BaseStrategy):
         # RSI=70 → confidence=0.0, RSI=100 → confidence=1.0 (for SELL)
         if is_oversold:
             signal = Signal.BUY
-            confidence = min(1.0, (self.oversold_threshold - rsi_val) / self.oversold_threshold)
+            confidence = (oversold - rsi_val) * self._inv_oversold
         else:
             signal = Signal.SELL
-            confidence = min(1.0, (rsi_val - self.overbought_threshold) / (100.0 - self.overbought_threshold))
+            confidence = (rsi_val - overbought) * self._inv_overbought
+        if confidence > 1.0:
+            confidence = 1.0
 
-        metadata: dict[str, Any] = {"rsi": round(rsi_val, 2)}
+        # Raw floats; rounding is left to whatever displays the values.
+        metadata: dict[str, Any] = {"rsi": rsi_val}
         if bb_z is not None:
-            metadata["bb_z"] = round(bb_z, 3)
+            metadata["bb_z"] = bb_z
         if bp is not None:
-            metadata["book_pressure"] = round(bp, 3)
+            metadata["book_pressure"] = bp
 
         return TradeSignal(
             timestamp=timestamp,
@@ -244,3 +324,80 @@ class RSIMeanReversionStrategy(BaseStrategy):
             confidence=confidence,
             metadata=metadata,
         )
+
+    # ------------------------------------------------------------------
+    # Batch evaluation
+    # ------------------------------------------------------------------
+
+    def batch_signals(
+        self,
+        prices: Sequence[float] | np.ndarray,
+        books: Sequence[dict] | None = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Evaluate the signal rules at every bar of a full series at once.
+
+        Equivalent to calling :meth:`on_step` on each bar with the full
+        history up to it (or any trailing window long enough to cover
+        ``rsi_period``, ``bb_period`` and ``trend_lookback``), ignoring
+        position gating.  Useful for parameter sweeps and signal studies.
+
+        Parameters
+        ----------
+        prices:
+            Full price series.
+        books:
+            Order book per bar, aligned with *prices*.  Required only when
+            ``book_pressure_confirm=True``.
+
+        Returns
+        -------
+        ``(signals, confidence)`` arrays of length ``len(prices)``: ``signals``
+        is ``+1`` for BUY, ``-1`` for SELL and ``0`` for no signal;
+        ``confidence`` is 0.0 wherever there is no signal.
+        """
+        p = np.asarray(prices, dtype=np.float64)
+        n = len(p)
+        rsi_arr = rsi_series(p, self.rsi_period)
+
+        # NaN RSI (not enough history) compares False, so those bars drop out
+        in_range = (p >= self.min_price) & (p <= self.max_price)
+        oversold = in_range & (rsi_arr < self.oversold_threshold)
+        overbought = in_range & (rsi_arr > self.overbought_threshold)
+
+        if self.trend_filter:
+            lb = self.trend_lookback
+            slope = np.full(n, np.nan)
+            if n > lb:
+                slope[lb:] = p[lb:] - p[: n - lb]
+            # NaN slope (not enough history) leaves the signal untouched
+            overbought &= ~(slope >= self.trend_threshold)
+            oversold &= ~(slope <= -self.trend_threshold)
+
+        if self.bb_confirm:
+            bb_z = bollinger_z_series(p, self.bb_period)
+            oversold &= bb_z <= -self.bb_z_min
+            overbought &= bb_z >= self.bb_z_min
+
+        if self.book_pressure_confirm:
+            if books is None:
+                raise ValueError("books are required when book_pressure_confirm=True")
+            depth = self.book_depth
+            for i in np.flatnonzero(oversold | overbought):
+                bp = book_pressure(books[i], depth)
+                if oversold[i] and bp <= 0:
+                    oversold[i] = False
+                if overbought[i] and bp >= 0:
+                    overbought[i] = False
+
+        signals = np.zeros(n, dtype=np.int8)
+        signals[oversold] = 1
+        signals[overbought] = -1
+
+        confidence = np.where(
+            oversold,
+            (self.oversold_threshold - rsi_arr) * self._inv_oversold,
+            np.where(overbought, (rsi_arr - self.overbought_threshold) * self._inv_overbought, 0.0),
+        )
+        np.minimum(confidence, 1.0, out=confidence)
+        return signals, confidence
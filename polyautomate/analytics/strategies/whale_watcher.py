@@ -47,34 +47,115 @@ clear directional trend to be contrarian to.
 from __future__ import annotations
 
 import math
+from collections import deque
 from typing import Any
 
-from ..models import Signal, TradeSignal
+import numpy as np
+
+from .._njit import HAVE_NUMBA, njit
+from ..models import BookSnapshot, Signal, TradeSignal
 from ..strategy import BaseStrategy
 
 
-def _best_notional(levels: list[list[float]]) -> float:
-    """Return the largest price*size product across all book levels."""
-    if not levels:
-        return 0.0
-    return max(price * size for price, size in levels)
+@njit(cache=True)
+def _side_notionals_kernel(prices: np.ndarray, sizes: np.ndarray) -> tuple[float, float]:
+    best = prices[0] * sizes[0]
+    total = 0.0
+    for i in range(prices.shape[0]):
+        v = prices[i] * sizes[i]
+        total += v
+        if v > best:
+            best = v
+    return best, total
 
 
-def _total_notional(levels: list[list[float]]) -> float:
-    """Return the sum of price*size across all book levels."""
-    return sum(price * size for price, size in levels)
+def _side_notionals(prices: np.ndarray, sizes: np.ndarray) -> tuple[float, float]:
+    """Return (largest, total) price*size across all levels of one book side."""
+    if len(prices) == 0:
+        return 0.0, 0.0
+    if HAVE_NUMBA:
+        return _side_notionals_kernel(prices, sizes)
+    notionals = prices * sizes
+    return float(notionals.max()), float(notionals.sum())
 
 
-def _rolling_mean_std(values: list[float]) -> tuple[float, float]:
-    """Compute mean and sample std-dev of a list."""
-    n = len(values)
-    if n == 0:
+def _level_notionals(levels: list[list[float]]) -> tuple[float, float]:
+    """Return (largest, total) price*size across ``[price, size]`` book levels."""
+    if not levels:
         return 0.0, 0.0
-    mean = sum(values) / n
-    if n < 2:
-        return mean, 0.0
-    variance = sum((v - mean) ** 2 for v in values) / (n - 1)
-    return mean, math.sqrt(variance)
+    notionals = [price * size for price, size in levels]
+    return max(notionals), sum(notionals)
+
+
+class _RollingStats:
+    """
+    O(1)-per-push mean and sample std-dev of the last ``size`` pushed values.
+
+    Keeps running sums relative to a shift (so the squares stay small),
+    re-seeding from the buffered values every ``size`` pushes to bound
+    rounding drift. A window of identical values is detected exactly and
+    reported with a zero std, as the two-pass formula gives.
+    """
+
+    __slots__ = ("_values", "_shift", "_s1", "_s2", "_flat_run", "_pushes")
+
+    def __init__(self, size: int) -> None:
+        self._values: deque[float] = deque(maxlen=max(size, 0))
+        self._shift = 0.0
+        self._s1 = 0.0
+        self._s2 = 0.0
+        self._flat_run = 0  # number of trailing equal values
+        self._pushes = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _seed(self) -> None:
+        values = self._values
+        last = values[-1]
+        self._shift = last
+        self._s1 = 0.0
+        self._s2 = 0.0
+        self._flat_run = 0
+        for v in reversed(values):
+            if v != last:
+                break
+            self._flat_run += 1
+        for v in values:
+            d = v - last
+            self._s1 += d
+            self._s2 += d * d
+        self._pushes = 0
+
+    def push(self, value: float) -> None:
+        values = self._values
+        size = values.maxlen
+        if not size:
+            return
+        if not values or self._pushes + 1 >= size:
+            values.append(value)
+            self._seed()
+            return
+        if len(values) == size:
+            d = values[0] - self._shift
+            self._s1 -= d
+            self._s2 -= d * d
+        self._flat_run = self._flat_run + 1 if value == values[-1] else 1
+        values.append(value)
+        d = value - self._shift
+        self._s1 += d
+        self._s2 += d * d
+        self._pushes += 1
+
+    def mean_std(self) -> tuple[float, float]:
+        n = len(self._values)
+        if n == 0:
+            return 0.0, 0.0
+        if self._flat_run >= n:
+            return self._values[-1], 0.0
+        mean_d = self._s1 / n
+        variance = (self._s2 - self._s1 * mean_d) / (n - 1)
+        return self._shift + mean_d, math.sqrt(max(variance, 0.0))
 
 
 class WhaleWatcherStrategy(BaseStrategy):
@@ -106,6 +187,22 @@ class WhaleWatcherStrategy(BaseStrategy):
         signal direction (additional confirmation filter).  Default True.
     """
 
+    __slots__ = (
+        "whale_z_threshold",
+        "trend_lookback",
+        "min_trend_move",
+        "min_whale_notional",
+        "stat_window",
+        "imbalance_confirm",
+        "_bid_stats",
+        "_ask_stats",
+        "_prev_imbalance",
+    )
+
+    # Book sides are only worth reading as arrays when the numba kernel
+    # handles them; otherwise plain-Python sums over dict levels are faster.
+    accepts_ndarray = HAVE_NUMBA
+
     def __init__(
         self,
         *,
@@ -123,9 +220,10 @@ class WhaleWatcherStrategy(BaseStrategy):
         self.stat_window = stat_window
         self.imbalance_confirm = imbalance_confirm
 
-        # Rolling history for normalisation (populated during on_step calls)
-        self._bid_notionals: list[float] = []
-        self._ask_notionals: list[float] = []
+        # Rolling notional stats for normalisation over the bars before the
+        # current one (populated during on_step calls)
+        self._bid_stats = _RollingStats(stat_window - 1)
+        self._ask_stats = _RollingStats(stat_window - 1)
         self._prev_imbalance: float | None = None
 
     # ------------------------------------------------------------------
@@ -152,48 +250,47 @@ class WhaleWatcherStrategy(BaseStrategy):
         *,
         timestamp: int,
         price: float,
-        book: dict,
+        book: dict | BookSnapshot,
         price_history: list[float],
         book_history: list[dict],
     ) -> TradeSignal | None:
-        bids: list[list[float]] = book.get("bids", [])
-        asks: list[list[float]] = book.get("asks", [])
-
-        bid_notional = _best_notional(bids)
-        ask_notional = _best_notional(asks)
-
-        # Maintain rolling notional history
-        self._bid_notionals.append(bid_notional)
-        self._ask_notionals.append(ask_notional)
-        if len(self._bid_notionals) > self.stat_window:
-            self._bid_notionals.pop(0)
-            self._ask_notionals.pop(0)
+        if isinstance(book, BookSnapshot):
+            bid_notional, total_bids = _side_notionals(book.bid_prices, book.bid_sizes)
+            ask_notional, total_asks = _side_notionals(book.ask_prices, book.ask_sizes)
+        else:
+            bid_notional, total_bids = _level_notionals(book.get("bids", []))
+            ask_notional, total_asks = _level_notionals(book.get("asks", []))
+
+        # Stats over the previous bars (excluding current), then add this bar
+        n_prev = len(self._bid_stats)
+        bid_mean, bid_std = self._bid_stats.mean_std()
+        ask_mean, ask_std = self._ask_stats.mean_std()
+        self._bid_stats.push(bid_notional)
+        self._ask_stats.push(ask_notional)
 
         # Need enough history for stats
-        if len(self._bid_notionals) < max(self.stat_window // 2, 5):
+        if n_prev + 1 < max(self.stat_window // 2, 5):
             return None
 
         # ---- Trend detection ----
-        if len(price_history) < self.trend_lookback + 1:
+        lookback = self.trend_lookback
+        if len(price_history) < lookback + 1:
             return None
-        trend_move = price_history[-1] - price_history[-self.trend_lookback - 1]
+        trend_move = float(price_history[-1] - price_history[-lookback - 1])
         if abs(trend_move) < self.min_trend_move:
             return None  # Flat market – skip
         trend_is_up = trend_move > 0
 
         # ---- Z-scores for whale detection ----
-        bid_mean, bid_std = _rolling_mean_std(self._bid_notionals[:-1])  # exclude current
-        ask_mean, ask_std = _rolling_mean_std(self._ask_notionals[:-1])
-
         bid_z = (bid_notional - bid_mean) / bid_std if bid_std > 0 else 0.0
         ask_z = (ask_notional - ask_mean) / ask_std if ask_std > 0 else 0.0
 
-        whale_on_bid = bid_z >= self.whale_z_threshold and bid_notional >= self.min_whale_notional
-        whale_on_ask = ask_z >= self.whale_z_threshold and ask_notional >= self.min_whale_notional
+        z_threshold = self.whale_z_threshold
+        min_notional = self.min_whale_notional
+        whale_on_bid = bid_z >= z_threshold and bid_notional >= min_notional
+        whale_on_ask = ask_z >= z_threshold and ask_notional >= min_notional
 
         # ---- Book imbalance confirmation ----
-        total_bids = _total_notional(bids)
-        total_asks = _total_notional(asks)
         denom = total_bids + total_asks
         imbalance = total_bids / denom if denom > 0 else 0.5
         imbalance_delta = (imbalance - self._prev_imbalance) if self._prev_imbalance is not None else 0.0
@@ -206,7 +303,7 @@ class WhaleWatcherStrategy(BaseStrategy):
                 # Imbalance did not swing toward bids – skip
                 pass
             else:
-                confidence = min(1.0, bid_z / (self.whale_z_threshold * 2))
+                confidence = min(1.0, bid_z / (z_threshold * 2))
                 return TradeSignal(
                     timestamp=timestamp,
                     market_id="",          # filled by engine if needed
@@ -215,11 +312,11 @@ class WhaleWatcherStrategy(BaseStrategy):
                     price_at_signal=price,
                     confidence=confidence,
                     metadata={
-                        "bid_z": round(bid_z, 2),
-                        "bid_notional": round(bid_notional, 2),
-                        "trend_move": round(trend_move, 4),
-                        "imbalance": round(imbalance, 4),
-                        "imbalance_delta": round(imbalance_delta, 4),
+                        "bid_z": bid_z,
+                        "bid_notional": bid_notional,
+                        "trend_move": trend_move,
+                        "imbalance": imbalance,
+                        "imbalance_delta": imbalance_delta,
                     },
                 )
 
@@ -229,7 +326,7 @@ class WhaleWatcherStrategy(BaseStrategy):
                 # Imbalance did not swing toward asks – skip
                 pass
             else:
-                confidence = min(1.0, ask_z / (self.whale_z_threshold * 2))
+                confidence = min(1.0, ask_z / (z_threshold * 2))
                 return TradeSignal(
                     timestamp=timestamp,
                     market_id="",
@@ -238,11 +335,11 @@ class WhaleWatcherStrategy(BaseStrategy):
                     price_at_signal=price,
                     confidence=confidence,
                     metadata={
-                        "ask_z": round(ask_z, 2),
-                        "ask_notional": round(ask_notional, 2),
-                        "trend_move": round(trend_move, 4),
-                        "imbalance": round(imbalance, 4),
-                        "imbalance_delta": round(imbalance_delta, 4),
+                        "ask_z": ask_z,
+                        "ask_notional": ask_notional,
+                        "trend_move": trend_move,
+                        "imbalance": imbalance,
+                        "imbalance_delta": imbalance_delta,
                     },
                 )
 
@@ -21,8 +21,21 @@ class BaseStrategy(ABC):
 
     The engine tracks open positions and calls the strategy for exit
     decisions via :meth:`should_exit`.
+
+    Subclasses whose indicators operate on NumPy arrays can set
+    :attr:`accepts_ndarray` to receive ``price_history`` as a read-only
+    float64 ``np.ndarray`` view instead of a fresh list each bar, and
+    ``book`` as a :class:`~polyautomate.analytics.models.BookSnapshot`
+    (parallel ``bid_prices``/``bid_sizes``/``ask_prices``/``ask_sizes``
+    arrays) instead of the raw dict (``book_history`` stays a list of dicts).
     """
 
+    # Empty so subclasses that declare ``__slots__`` get no instance dict.
+    __slots__ = ()
+
+    #: When True, ``on_step`` gets array-native ``price_history`` and ``book``.
+    accepts_ndarray: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import threading
+from typing import Any, Dict, NamedTuple, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:  # faster decoding of large responses; stdlib json is the fallback
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from ..exceptions import PolymarketAPIError
 
 DEFAULT_BASE_URL = "https://clob.polymarket.com"
+USER_AGENT = "polyautomate/0.1"
 
 
 def _normalize_path(path: str) -> str:
@@ -18,17 +26,85 @@ def _normalize_path(path: str) -> str:
 
 
 def _json_dumps(data: Dict[str, Any] | None) -> str:
+    # Stays on stdlib json: this string is the HMAC signing input and orjson
+    # formats floats and non-ASCII text differently (e.g. 1e-05 vs 0.00001).
     if not data:
         return ""
     return json.dumps(data, separators=(",", ":"), sort_keys=True)
 
 
-@dataclass(slots=True)
-class RequestContext:
+def _json_loads(content: bytes) -> Any:
+    if orjson is not None:
+        try:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
+            pass  # e.g. NaN literals or >64-bit ints, which stdlib accepts
+    return json.loads(content)
+
+
+_DEFAULT_SESSION: Optional[requests.Session] = None
+_DEFAULT_SESSION_LOCK = threading.Lock()
+
+
+def get_default_session() -> requests.Session:
+    """
+    Process-wide session shared by clients constructed without one.
+
+    Sharing it means every client (and every backtest that builds new ones)
+    reuses the same pool of keep-alive connections instead of paying a new
+    TCP + TLS handshake per instance.  ``requests.Session`` is safe to use
+    from several threads for plain requests; do not mutate its headers or
+    adapters after construction — pass a dedicated session instead.
+    """
+    global _DEFAULT_SESSION
+    if _DEFAULT_SESSION is None:
+        with _DEFAULT_SESSION_LOCK:
+            if _DEFAULT_SESSION is None:
+                _DEFAULT_SESSION = _default_session()
+    return _DEFAULT_SESSION
+
+
+def _default_session() -> requests.Session:
+    """
+    Session with a larger keep-alive pool and retries for idempotent reads.
+
+    Only GETs are retried (with backoff, honouring ``Retry-After``); order
+    placement and cancellation must never be replayed implicitly.  The last
+    response is returned rather than raised so callers still see the API's
+    error payload.
+    """
+    session = requests.Session()
+    session.headers.update({"User-Agent": USER_AGENT})
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class RequestContext(NamedTuple):
     method: str
     path: str
     body: Dict[str, Any] | None
     params: Dict[str, Any] | None
+    # Pre-serialised ``body`` (e.g. the exact bytes that were signed); sent
+    # as-is instead of re-encoding ``body`` when set.
+    body_bytes: bytes | None = None
+
+
+def _body_headers(ctx: RequestContext, headers: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+    if ctx.body_bytes is None:
+        return headers
+    return {**(headers or {}), "Content-Type": "application/json"}
 
 
 class BaseAPIClient:
@@ -42,9 +118,54 @@ class BaseAPIClient:
         timeout: float = 10.0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
-        self.session = session or requests.Session()
+        self.session = session or get_default_session()
         self.timeout = timeout
 
+    def _async_client(self) -> Any:
+        """Build an ``httpx.AsyncClient`` for one batch of concurrent requests."""
+        try:
+            import httpx
+        except ImportError as exc:  # pragma: no cover - optional dependency
+            raise ImportError(
+                "httpx is required for batched async requests. Install it with 'pip install httpx'."
+            ) from exc
+        try:
+            import h2  # noqa: F401  # enables HTTP/2 multiplexing
+            http2 = True
+        except ImportError:
+            http2 = False
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=http2,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=self.timeout,
+            headers=dict(self.session.headers),
+        )
+
+    async def _arequest(
+        self,
+        client: Any,
+        ctx: RequestContext,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Async counterpart of :meth:`_request` on a client from :meth:`_async_client`."""
+        response = await client.request(
+            ctx.method,
+            ctx.path,
+            params=ctx.params,
+            json=ctx.body if ctx.body_bytes is None else None,
+            content=ctx.body_bytes,
+            headers=_body_headers(ctx, headers),
+        )
+        if response.status_code >= 400:
+            raise PolymarketAPIError(
+                response.status_code, response.text or response.reason_phrase, payload=_safe_json(response)
+            )
+        if not response.content:
+            return None
+        return _json_loads(response.content)
+
     def _request(
         self,
         ctx: RequestContext,
@@ -56,8 +177,9 @@ class BaseAPIClient:
             ctx.method,
             url,
             params=ctx.params,
-            json=ctx.body,
-            headers=headers,
+            json=ctx.body if ctx.body_bytes is None else None,
+            data=ctx.body_bytes,
+            headers=_body_headers(ctx, headers),
             timeout=self.timeout,
         )
         if response.status_code >= 400:
@@ -66,12 +188,12 @@ class BaseAPIClient:
             )
         if not response.content:
             return None
-        return response.json()
+        return _json_loads(response.content)
 
 
-def _safe_json(response: requests.Response) -> Dict[str, Any]:
+def _safe_json(response: Any) -> Dict[str, Any]:
     try:
-        return response.json()  # type: ignore[return-value]
+        return _json_loads(response.content)  # type: ignore[return-value]
     except ValueError:
         return {}
 
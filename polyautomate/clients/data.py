@@ -1,10 +1,20 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional, Sequence
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
 
-from .base import BaseAPIClient, DEFAULT_BASE_URL, RequestContext, _coerce_timestamp
-from ..models import PricePoint
+import numpy as np
+
+from .base import BaseAPIClient, DEFAULT_BASE_URL, RequestContext, _coerce_timestamp, _safe_json
+from ..exceptions import PolymarketAPIError
+from ..models import PricePoint, _ensure_decimal
 
 _INTERVAL_ALIASES = {
     "1m": "1m",
@@ -33,8 +43,15 @@ _INTERVAL_ALIASES = {
 
 _SUPPORTED_INTERVALS = {"1m", "1h", "6h", "1d", "1w", "max"}
 
+# A history window is only cached once its end is at least this far in the
+# past, so late-arriving points of the most recent bars are not frozen.
+_HISTORY_CACHE_SETTLE_SECONDS = 3600
+
 
+@lru_cache(maxsize=64)
 def _normalize_interval(interval: str) -> str:
+    if interval in _SUPPORTED_INTERVALS:
+        return interval
     key = interval.lower().replace(" ", "").replace("-", "_")
     normalized = _INTERVAL_ALIASES.get(key)
     if normalized:
@@ -46,13 +63,16 @@ def _normalize_interval(interval: str) -> str:
     )
 
 
+_PRICE_HISTORY_KEYS = ("data", "prices", "history", "results", "points")
+
+
 def _extract_price_history_records(payload: Any) -> Sequence[Any]:
     if payload is None:
         return []
     if isinstance(payload, list):
         return payload
     if isinstance(payload, dict):
-        for key in ("data", "prices", "history", "results", "points"):
+        for key in _PRICE_HISTORY_KEYS:
             value = payload.get(key)
             if isinstance(value, list):
                 return value
@@ -61,8 +81,42 @@ def _extract_price_history_records(payload: Any) -> Sequence[Any]:
     return []
 
 
+def _price_history_arrays(records: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Columnar ``(timestamps, prices)`` for price history records."""
+    n = len(records)
+    try:
+        # Fast path for the CLOB's ``{"t": ..., "p": ...}`` records.
+        ts = np.fromiter((r["t"] for r in records), dtype=np.float64, count=n)
+        prices = np.fromiter((r["p"] for r in records), dtype=np.float64, count=n)
+        return ts.astype(np.int64), prices
+    except (KeyError, TypeError, ValueError):
+        pass
+    ts = np.empty(n, dtype=np.int64)
+    prices = np.empty(n, dtype=np.float64)
+    for i, item in enumerate(records):
+        point = PricePoint.from_api(item)
+        ts[i] = int(point.timestamp.timestamp())
+        prices[i] = float(point.price)
+    return ts, prices
+
+
+def _save_history_arrays(path: str, ts: np.ndarray, prices: np.ndarray) -> None:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp = f"{path}.tmp.npz"
+    np.savez(tmp, ts=ts, price=prices)
+    os.replace(tmp, path)
+
+
 class PolymarketDataClient(BaseAPIClient):
-    """Focused helper for price history and trade data."""
+    """
+    Focused helper for price history and trade data.
+
+    With ``cache_dir`` set, price history requested for an explicit
+    ``start_time``/``end_time`` window is stored there as ``.npz`` columns
+    and served from disk on later calls.  Only windows that ended at least
+    an hour ago are cached; interval-only requests (relative to "now") and
+    windows reaching into the present are always fetched.
+    """
 
     def __init__(
         self,
@@ -70,8 +124,46 @@ class PolymarketDataClient(BaseAPIClient):
         base_url: str = DEFAULT_BASE_URL,
         session=None,
         timeout: float = 10.0,
+        cache_dir: str | None = None,
     ) -> None:
         super().__init__(base_url=base_url, session=session, timeout=timeout)
+        self._cache_dir = cache_dir
+        # Envelope key the API last wrapped price history records in
+        self._price_history_key: str | None = None
+
+    def _history_cache_path(self, ctx: RequestContext) -> str | None:
+        if self._cache_dir is None or not ctx.params or "startTs" not in ctx.params:
+            return None
+        if ctx.params["endTs"] > time.time() - _HISTORY_CACHE_SETTLE_SECONDS:
+            return None
+        raw = json.dumps({"url": f"{self.base_url}{ctx.path}", "params": ctx.params}, sort_keys=True)
+        key = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self._cache_dir, f"{key}.npz")
+
+    def _fetch_price_history_arrays(self, ctx: RequestContext) -> Tuple[np.ndarray, np.ndarray]:
+        path = self._history_cache_path(ctx)
+        if path is not None and os.path.exists(path):
+            with np.load(path) as data:
+                return data["ts"], data["price"]
+        arrays = _price_history_arrays(self._price_history_records(self._request(ctx)))
+        if path is not None:
+            _save_history_arrays(path, *arrays)
+        return arrays
+
+    def _price_history_records(self, payload: Any) -> Sequence[Any]:
+        """:func:`_extract_price_history_records`, trying the last-seen key first."""
+        if isinstance(payload, dict):
+            key = self._price_history_key
+            if key is not None:
+                value = payload.get(key)
+                if isinstance(value, list):
+                    return value
+            for key in _PRICE_HISTORY_KEYS:
+                value = payload.get(key)
+                if isinstance(value, list):
+                    self._price_history_key = key
+                    return value
+        return _extract_price_history_records(payload)
 
     def get_price_history(
         self,
@@ -83,6 +175,159 @@ class PolymarketDataClient(BaseAPIClient):
         start_time: Optional[datetime | int | float] = None,
         end_time: Optional[datetime | int | float] = None,
     ) -> List[PricePoint]:
+        ctx = self._price_history_context(
+            market_id,
+            token_id,
+            interval=interval,
+            fidelity_minutes=fidelity_minutes,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        path = self._history_cache_path(ctx)
+        if path is not None and os.path.exists(path):
+            ts, prices = self._fetch_price_history_arrays(ctx)
+            return [
+                PricePoint(
+                    timestamp=datetime.fromtimestamp(t, tz=timezone.utc),
+                    price=_ensure_decimal(p),
+                )
+                for t, p in zip(ts.tolist(), prices.tolist())
+            ]
+        payload = self._request(ctx)
+        records = self._price_history_records(payload)
+        if path is not None:
+            _save_history_arrays(path, *_price_history_arrays(records))
+        return [PricePoint.from_api(item) for item in records]
+
+    def iter_price_history(
+        self,
+        market_id: str,
+        token_id: str,
+        *,
+        interval: str = "1h",
+        fidelity_minutes: Optional[int] = None,
+        start_time: Optional[datetime | int | float] = None,
+        end_time: Optional[datetime | int | float] = None,
+    ) -> Iterator[PricePoint]:
+        """
+        Yield the records of :meth:`get_price_history` as they are parsed.
+
+        With ``ijson`` installed the response body is parsed incrementally
+        from the socket, so a long history never exists in memory as one
+        decoded document.  Without it this falls back to a regular request.
+        """
+        ctx = self._price_history_context(
+            market_id,
+            token_id,
+            interval=interval,
+            fidelity_minutes=fidelity_minutes,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        try:
+            import ijson
+        except ImportError:
+            for item in self._price_history_records(self._request(ctx)):
+                yield PricePoint.from_api(item)
+            return
+
+        response = self.session.request(
+            ctx.method,
+            f"{self.base_url}{ctx.path}",
+            params=ctx.params,
+            timeout=self.timeout,
+            stream=True,
+        )
+        with response:
+            if response.status_code >= 400:
+                raise PolymarketAPIError(
+                    response.status_code, response.text or response.reason, payload=_safe_json(response)
+                )
+            response.raw.decode_content = True
+            events = ijson.parse(response.raw)
+            # Buffer events until the records array shows up: either the
+            # document itself or one of the known envelope keys.
+            head: list[tuple[str, str, Any]] = []
+            prefix: str | None = None
+            for event in events:
+                head.append(event)
+                if event[1] == "start_array" and (event[0] == "" or event[0] in _PRICE_HISTORY_KEYS):
+                    prefix = event[0]
+                    break
+            if prefix is None:
+                # Single-record payloads and the like: rebuild and reuse the
+                # regular extraction.
+                documents = list(ijson.items(iter(head), ""))
+                records = self._price_history_records(documents[0]) if documents else []
+            else:
+                if prefix:
+                    self._price_history_key = prefix
+                item_prefix = f"{prefix}.item" if prefix else "item"
+                records = ijson.items(itertools.chain(head, events), item_prefix)
+            for item in records:
+                yield PricePoint.from_api(item)
+
+    def get_price_history_arrays(
+        self,
+        market_id: str,
+        token_id: str,
+        *,
+        interval: str = "1h",
+        fidelity_minutes: Optional[int] = None,
+        start_time: Optional[datetime | int | float] = None,
+        end_time: Optional[datetime | int | float] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Same request as :meth:`get_price_history`, returned as columns.
+
+        Returns ``(timestamps, prices)``: Unix seconds as ``int64`` and prices
+        as ``float64``, without building a :class:`PricePoint` per record.
+        """
+        ctx = self._price_history_context(
+            market_id,
+            token_id,
+            interval=interval,
+            fidelity_minutes=fidelity_minutes,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        return self._fetch_price_history_arrays(ctx)
+
+    def get_price_history_batch(self, specs: Sequence[Mapping[str, Any]]) -> List[List[PricePoint]]:
+        """
+        Fetch several price histories concurrently.
+
+        Each spec holds the keyword arguments of :meth:`get_price_history`
+        (``market_id``, ``token_id`` and optionally ``interval``,
+        ``fidelity_minutes``, ``start_time``, ``end_time``).  Results are
+        returned in spec order.  Requires ``httpx``; uses HTTP/2 when ``h2``
+        is installed.  Must not be called from a running event loop — await
+        :meth:`aget_price_history_batch` there instead.
+        """
+        return asyncio.run(self.aget_price_history_batch(specs))
+
+    async def aget_price_history_batch(
+        self, specs: Sequence[Mapping[str, Any]]
+    ) -> List[List[PricePoint]]:
+        """Async variant of :meth:`get_price_history_batch`."""
+        contexts = [self._price_history_context(**spec) for spec in specs]
+        async with self._async_client() as client:
+            payloads = await asyncio.gather(*(self._arequest(client, ctx) for ctx in contexts))
+        return [
+            [PricePoint.from_api(item) for item in self._price_history_records(payload)]
+            for payload in payloads
+        ]
+
+    def _price_history_context(
+        self,
+        market_id: str,
+        token_id: str,
+        *,
+        interval: str = "1h",
+        fidelity_minutes: Optional[int] = None,
+        start_time: Optional[datetime | int | float] = None,
+        end_time: Optional[datetime | int | float] = None,
+    ) -> RequestContext:
         params: Dict[str, Any] = {"market": token_id}
         has_start = start_time is not None
         has_end = end_time is not None
@@ -107,15 +352,12 @@ class PolymarketDataClient(BaseAPIClient):
                 params["fidelity"] = fidelity_value
             elif min_fidelity is not None:
                 params["fidelity"] = min_fidelity
-        ctx = RequestContext(
+        return RequestContext(
             method="GET",
             path="/prices-history",
             body=None,
             params=params,
         )
-        payload = self._request(ctx)
-        records = _extract_price_history_records(payload)
-        return [PricePoint.from_api(item) for item in records]
 
     def get_trades(
         self,
@@ -37,15 +37,38 @@ Example::
 from __future__ import annotations
 
 import logging
+import random
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any, Iterator
 
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+from .base import _json_loads
+
+try:  # incremental parsing of very large pages
+    import ijson
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=512)
+def _isoformat_utc(value: datetime) -> str:
+    # Callers sweeping windows pass the same datetimes over and over.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.isoformat()
+
+
 class PMDError(Exception):
     """Raised when the polymarketdata.co API returns an error response."""
 
@@ -65,24 +88,48 @@ class PMDClient:
     timeout:
         Request timeout in seconds. Defaults to 30.
     retry_on_rate_limit:
-        When True (default), automatically wait and retry once on HTTP 429.
-        The client respects the ``Retry-After`` header when present, otherwise
-        waits 61 seconds (just past the 1-minute window on the free plan).
+        When True (default), automatically wait and retry on HTTP 429.
+        The client respects the ``Retry-After`` header (seconds or HTTP date)
+        when present, otherwise backs off exponentially with jitter
+        (2, 4, 8, 16, 32 s plus up to 50%, so the retries outlast the
+        1-minute window on the free plan).  While one request is backing
+        off, other threads sharing the client wait too.
+    max_retries:
+        Maximum number of retries per request on HTTP 429.  Defaults to 5.
     """
 
     BASE_URL = "https://api.polymarketdata.co"
 
+    # Pages larger than this (by Content-Length) are parsed from the socket
+    # with ijson, when installed, instead of being buffered first.
+    _STREAM_THRESHOLD = 8 * 1024 * 1024
+
+    # Exponential backoff for 429 responses without a usable Retry-After
+    _BACKOFF_BASE = 2.0
+    _BACKOFF_MAX = 60.0
+    _BACKOFF_JITTER = 0.5
+
     def __init__(
         self,
         api_key: str,
         *,
         timeout: float = 30.0,
         retry_on_rate_limit: bool = True,
+        max_retries: int = 5,
     ) -> None:
         self.api_key = api_key
         self._timeout = timeout
         self._retry_on_rate_limit = retry_on_rate_limit
+        self._max_retries = max_retries
+        # Monotonic time before which no request should be sent (shared by
+        # concurrent fetches so they back off together).
+        self._rate_limited_until = 0.0
+        self._rate_limit_lock = threading.Lock()
         self._session = requests.Session()
+        # Room for concurrent page fetches to one host.  No adapter-level
+        # retries: rate limiting is handled in _get.  (urllib3 already sets
+        # TCP_NODELAY and requests keeps connections alive by default.)
+        self._session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
         self._session.headers.update(
             {
                 "X-API-Key": api_key,
@@ -94,22 +141,66 @@ class PMDClient:
     # Low-level transport
     # ------------------------------------------------------------------
 
+    def _retry_delay(self, resp: requests.Response, attempt: int) -> float:
+        """Seconds to wait after a 429: ``Retry-After`` if usable, else backoff."""
+        header = resp.headers.get("Retry-After")
+        if header:
+            try:
+                return max(float(header), 0.0)
+            except ValueError:
+                pass
+            try:
+                retry_at = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                retry_at = None
+            if retry_at is not None:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+        delay = min(self._BACKOFF_BASE * 2**attempt, self._BACKOFF_MAX)
+        return delay * (1.0 + self._BACKOFF_JITTER * random.random())
+
+    def _decode(self, resp: requests.Response) -> Any:
+        """
+        Decode a successful (streamed) response.
+
+        Large bodies are parsed incrementally so the raw bytes and the decoded
+        document are never both held in memory.
+        """
+        length = resp.headers.get("Content-Length")
+        if ijson is None or not length or int(length) < self._STREAM_THRESHOLD:
+            return _json_loads(resp.content)
+        with resp:
+            resp.raw.decode_content = True
+            return next(ijson.items(resp.raw, "", use_float=True))
+
+    def _wait_for_rate_limit(self) -> None:
+        wait = self._rate_limited_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+
     def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
         url = f"{self.BASE_URL}{path}"
-        for attempt in range(2):
-            resp = self._session.get(url, params=params, timeout=self._timeout)
-            if resp.status_code == 429 and self._retry_on_rate_limit and attempt == 0:
-                wait = int(resp.headers.get("Retry-After", 61))
-                logger.warning("Rate limited; waiting %ds before retry…", wait)
-                time.sleep(wait)
+        attempts = self._max_retries + 1 if self._retry_on_rate_limit else 1
+        for attempt in range(attempts):
+            self._wait_for_rate_limit()
+            resp = self._session.get(url, params=params, timeout=self._timeout, stream=True)
+            if resp.status_code == 429 and attempt + 1 < attempts:
+                resp.close()
+                wait = self._retry_delay(resp, attempt)
+                with self._rate_limit_lock:
+                    self._rate_limited_until = max(
+                        self._rate_limited_until, time.monotonic() + wait
+                    )
+                logger.warning("Rate limited; waiting %.1fs before retry…", wait)
                 continue
             if not resp.ok:
                 try:
-                    detail = resp.json().get("detail", resp.text)
+                    detail = _json_loads(resp.content).get("detail", resp.text)
                 except Exception:
                     detail = resp.text
                 raise PMDError(resp.status_code, str(detail))
-            return resp.json()
+            return self._decode(resp)
         # Should not be reached, but satisfy type checker
         raise PMDError(429, "Rate limit retry exhausted")
 
@@ -275,11 +366,138 @@ class PMDClient:
     @staticmethod
     def _ts(value: datetime | int | str) -> str:
         """Normalise a timestamp argument to an ISO-8601 string."""
+        if isinstance(value, str):
+            return value
+        if isinstance(value, datetime):
+            return _isoformat_utc(value)
+        return str(value)
+
+    # Bar length per resolution, used to split a time range into shards.
+    _RESOLUTION_SECONDS = {"1m": 60, "10m": 600, "1h": 3600, "6h": 21600, "1d": 86400}
+
+    @staticmethod
+    def _epoch(value: datetime | int | str) -> int | None:
+        """Unix seconds for a timestamp argument, or ``None`` if unparseable."""
         if isinstance(value, datetime):
             if value.tzinfo is None:
                 value = value.replace(tzinfo=timezone.utc)
-            return value.isoformat()
-        return str(value)
+            return int(value.timestamp())
+        if isinstance(value, int):
+            return value
+        text = str(value)
+        if text.isdigit():
+            return int(text)
+        try:
+            parsed = datetime.fromisoformat(text.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if parsed.tzinfo is None:
+            parsed = parsed.replace(tzinfo=timezone.utc)
+        return int(parsed.timestamp())
+
+    def _iter_pages(self, path: str, params: dict[str, Any]) -> Iterator[Any]:
+        """Follow ``next_cursor`` from *params*, yielding each page's ``data``."""
+        params = dict(params)
+        while True:
+            resp = self._get(path, params)
+            yield resp.get("data", [])
+            cursor = resp.get("metadata", {}).get("next_cursor")
+            if not cursor:
+                return
+            params["cursor"] = cursor
+
+    def _pages(self, path: str, params: dict[str, Any]) -> list[Any]:
+        """Follow ``next_cursor`` from *params* and return every page's ``data``."""
+        return list(self._iter_pages(path, params))
+
+    def _history_params(
+        self,
+        start_ts: datetime | int | str,
+        end_ts: datetime | int | str,
+        resolution: str,
+        limit: int,
+    ) -> dict[str, Any]:
+        return {
+            "start_ts": self._ts(start_ts),
+            "end_ts": self._ts(end_ts),
+            "resolution": resolution,
+            "limit": limit,
+        }
+
+    def _history_pages(
+        self,
+        path: str,
+        start_ts: datetime | int | str,
+        end_ts: datetime | int | str,
+        resolution: str,
+        limit: int,
+        workers: int,
+    ) -> list[list[Any]]:
+        """
+        Fetch a history endpoint and return its pages grouped by shard.
+
+        With ``workers > 1`` the range is split into shards of ``limit`` bars
+        that are fetched concurrently (each still follows its own cursor);
+        otherwise, or when the range cannot be parsed, the whole range is one
+        shard.  Shards are returned in time order.
+        """
+        params = self._history_params(start_ts, end_ts, resolution, limit)
+        start, end = self._epoch(start_ts), self._epoch(end_ts)
+        step = self._RESOLUTION_SECONDS.get(resolution, 0) * limit
+        if workers <= 1 or start is None or end is None or step <= 0 or end - start <= step:
+            return [self._pages(path, params)]
+
+        # Shard bounds go out in the same ISO-8601 form as unsharded requests.
+        shards = [
+            {**params, "start_ts": self._ts_iso(lo), "end_ts": self._ts_iso(min(lo + step, end))}
+            for lo in range(start, end, step)
+        ]
+        with ThreadPoolExecutor(max_workers=min(workers, len(shards))) as pool:
+            return list(pool.map(lambda shard: self._pages(path, shard), shards))
+
+    @staticmethod
+    def _ts_iso(epoch: int) -> str:
+        return _isoformat_utc(datetime.fromtimestamp(epoch, tz=timezone.utc))
+
+    @staticmethod
+    def _point_ts(point: dict) -> Any:
+        # Price points carry ``t``; metrics / books use ``ts``.
+        return point.get("t", point.get("ts"))
+
+    @classmethod
+    def _point_epoch(cls, point: dict) -> int:
+        """Unix seconds of a point's ISO ``t`` (or integer ``ts``); 0 if unparseable."""
+        value = cls._point_ts(point)
+        if isinstance(value, (int, float)):
+            return int(value)
+        epoch = cls._epoch(value) if value is not None else None
+        return 0 if epoch is None else epoch
+
+    @classmethod
+    def _merge_points(cls, result: list[dict], points: list[dict], first_page: bool) -> None:
+        # Adjacent shards share their boundary timestamp when the API treats
+        # end_ts as inclusive; drop the repeated point (never when either
+        # side has no timestamp to compare).
+        if first_page and result and points:
+            ts = cls._point_ts(points[0])
+            if ts is not None and ts == cls._point_ts(result[-1]):
+                points = points[1:]
+        result.extend(points)
+
+    def _merge_list(self, shards: list[list[Any]]) -> list[dict]:
+        result: list[dict] = []
+        for pages in shards:
+            for page_no, points in enumerate(pages):
+                self._merge_points(result, points, page_no == 0)
+        return result
+
+    def _merge_keyed(self, shards: list[list[Any]]) -> dict[str, list[dict]]:
+        result: defaultdict[str, list] = defaultdict(list)
+        for pages in shards:
+            for page_no, page in enumerate(pages):
+                for label, points in (page or {}).items():
+                    self._merge_points(result[label], points, page_no == 0)
+        return dict(result)
 
     def get_prices(
         self,
@@ -289,6 +507,7 @@ class PMDClient:
         resolution: str = "1h",
         *,
         limit: int = 200,
+        workers: int = 1,
     ) -> dict[str, list[dict]]:
         """
         Fetch token price history for all outcomes of a market.
@@ -304,6 +523,10 @@ class PMDClient:
             Candle interval: ``"1m"``, ``"10m"``, ``"1h"``, ``"6h"``, ``"1d"``.
         limit:
             Page size (max 200).
+        workers:
+            Number of concurrent requests.  Above 1 the range is split into
+            ``limit``-bar shards fetched in parallel (watch your plan's rate
+            limit).  Also accepted by the other history methods.
 
         Returns
         -------
@@ -311,24 +534,75 @@ class PMDClient:
             ``{token_label: [{ts: int, price: float}, ...]}``
             Prices are probabilities in ``[0.0, 1.0]``.
         """
-        params: dict[str, Any] = {
-            "start_ts": self._ts(start_ts),
-            "end_ts": self._ts(end_ts),
-            "resolution": resolution,
-            "limit": limit,
+        shards = self._history_pages(
+            f"/v1/markets/{id_or_slug}/prices", start_ts, end_ts, resolution, limit, workers
+        )
+        return self._merge_keyed(shards)
+
+    def iter_prices(
+        self,
+        id_or_slug: str,
+        start_ts: datetime | int | str,
+        end_ts: datetime | int | str,
+        resolution: str = "1h",
+        *,
+        limit: int = 200,
+    ) -> Iterator[tuple[str, dict]]:
+        """
+        Stream :meth:`get_prices` one page at a time.
+
+        Yields ``(token_label, {ts, price})`` pairs, each label's points in
+        time order.  The next page is only requested once the current one
+        is consumed, so a long range is never held in memory at once.
+        """
+        params = self._history_params(start_ts, end_ts, resolution, limit)
+        for page in self._iter_pages(f"/v1/markets/{id_or_slug}/prices", params):
+            for label, points in (page or {}).items():
+                for point in points:
+                    yield label, point
+
+    def get_prices_arrays(
+        self,
+        id_or_slug: str,
+        start_ts: datetime | int | str,
+        end_ts: datetime | int | str,
+        resolution: str = "1h",
+        *,
+        limit: int = 200,
+        workers: int = 1,
+    ) -> dict[str, tuple[np.ndarray, np.ndarray]]:
+        """
+        Same request as :meth:`get_prices`, returned as columns.
+
+        Returns ``{token_label: (ts, price)}`` with ``ts`` as ``int64`` Unix
+        seconds and ``price`` as ``float64``.  Each page is converted as it
+        arrives, so no per-point dicts are kept for the whole range.
+        """
+        shards = self._history_pages(
+            f"/v1/markets/{id_or_slug}/prices", start_ts, end_ts, resolution, limit, workers
+        )
+        chunks: defaultdict[str, list[tuple[np.ndarray, np.ndarray]]] = defaultdict(list)
+        for pages in shards:
+            for page_no, page in enumerate(pages):
+                for label, points in (page or {}).items():
+                    n = len(points)
+                    ts = np.fromiter((self._point_epoch(p) for p in points), dtype=np.int64, count=n)
+                    price = np.fromiter(
+                        (p["p"] if "p" in p else p["price"] for p in points), dtype=np.float64, count=n
+                    )
+                    parts = chunks[label]
+                    # Same shard-boundary de-duplication as _merge_points
+                    prev_ts = parts[-1][0] if parts else ()
+                    if page_no == 0 and n and len(prev_ts) and prev_ts[-1] == ts[0]:
+                        ts, price = ts[1:], price[1:]
+                    parts.append((ts, price))
+        return {
+            label: (
+                np.concatenate([ts for ts, _ in parts]),
+                np.concatenate([price for _, price in parts]),
+            )
+            for label, parts in chunks.items()
         }
-        result: dict[str, list] = {}
-        cursor: str | None = None
-        while True:
-            if cursor:
-                params["cursor"] = cursor
-            resp = self._get(f"/v1/markets/{id_or_slug}/prices", params)
-            for label, points in resp.get("data", {}).items():
-                result.setdefault(label, []).extend(points)
-            cursor = resp.get("metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        return result
 
     def get_token_prices(
         self,
@@ -338,6 +612,7 @@ class PMDClient:
         resolution: str = "1h",
         *,
         limit: int = 200,
+        workers: int = 1,
     ) -> list[dict]:
         """
         Fetch price history for a single token.
@@ -347,23 +622,10 @@ class PMDClient:
         list
             ``[{ts: int, price: float}, ...]``
         """
-        params: dict[str, Any] = {
-            "start_ts": self._ts(start_ts),
-            "end_ts": self._ts(end_ts),
-            "resolution": resolution,
-            "limit": limit,
-        }
-        result: list[dict] = []
-        cursor: str | None = None
-        while True:
-            if cursor:
-                params["cursor"] = cursor
-            resp = self._get(f"/v1/tokens/{token_id}/prices", params)
-            result.extend(resp.get("data", []))
-            cursor = resp.get("metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        return result
+        shards = self._history_pages(
+            f"/v1/tokens/{token_id}/prices", start_ts, end_ts, resolution, limit, workers
+        )
+        return self._merge_list(shards)
 
     def get_metrics(
         self,
@@ -373,6 +635,7 @@ class PMDClient:
         resolution: str = "1h",
         *,
         limit: int = 200,
+        workers: int = 1,
     ) -> list[dict]:
         """
         Fetch market metrics over a time range.
@@ -380,23 +643,10 @@ class PMDClient:
         Each data point contains ``ts``, ``volume``, ``liquidity``, and
         ``spread`` fields.
         """
-        params: dict[str, Any] = {
-            "start_ts": self._ts(start_ts),
-            "end_ts": self._ts(end_ts),
-            "resolution": resolution,
-            "limit": limit,
-        }
-        result: list[dict] = []
-        cursor: str | None = None
-        while True:
-            if cursor:
-                params["cursor"] = cursor
-            resp = self._get(f"/v1/markets/{id_or_slug}/metrics", params)
-            result.extend(resp.get("data", []))
-            cursor = resp.get("metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        return result
+        shards = self._history_pages(
+            f"/v1/markets/{id_or_slug}/metrics", start_ts, end_ts, resolution, limit, workers
+        )
+        return self._merge_list(shards)
 
     def get_books(
         self,
@@ -406,6 +656,7 @@ class PMDClient:
         resolution: str = "1h",
         *,
         limit: int = 200,
+        workers: int = 1,
     ) -> dict[str, list[dict]]:
         """
         Fetch order book snapshots for all tokens of a market.
@@ -423,24 +674,10 @@ class PMDClient:
         dict
             ``{token_label: [snapshot, ...]}``
         """
-        params: dict[str, Any] = {
-            "start_ts": self._ts(start_ts),
-            "end_ts": self._ts(end_ts),
-            "resolution": resolution,
-            "limit": limit,
-        }
-        result: dict[str, list] = {}
-        cursor: str | None = None
-        while True:
-            if cursor:
-                params["cursor"] = cursor
-            resp = self._get(f"/v1/markets/{id_or_slug}/books", params)
-            for label, snapshots in resp.get("data", {}).items():
-                result.setdefault(label, []).extend(snapshots)
-            cursor = resp.get("metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        return result
+        shards = self._history_pages(
+            f"/v1/markets/{id_or_slug}/books", start_ts, end_ts, resolution, limit, workers
+        )
+        return self._merge_keyed(shards)
 
     def get_token_books(
         self,
@@ -450,6 +687,7 @@ class PMDClient:
         resolution: str = "1h",
         *,
         limit: int = 200,
+        workers: int = 1,
     ) -> list[dict]:
         """
         Fetch order book snapshots for a single token.
@@ -459,20 +697,7 @@ class PMDClient:
         list
             ``[{ts, bids, asks}, ...]``
         """
-        params: dict[str, Any] = {
-            "start_ts": self._ts(start_ts),
-            "end_ts": self._ts(end_ts),
-            "resolution": resolution,
-            "limit": limit,
-        }
-        result: list[dict] = []
-        cursor: str | None = None
-        while True:
-            if cursor:
-                params["cursor"] = cursor
-            resp = self._get(f"/v1/tokens/{token_id}/books", params)
-            result.extend(resp.get("data", []))
-            cursor = resp.get("metadata", {}).get("next_cursor")
-            if not cursor:
-                break
-        return result
+        shards = self._history_pages(
+            f"/v1/tokens/{token_id}/books", start_ts, end_ts, resolution, limit, workers
+        )
+        return self._merge_list(shards)
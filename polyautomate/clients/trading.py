@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import hashlib
 import hmac as _hmac
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from .base import BaseAPIClient, DEFAULT_BASE_URL, RequestContext, _json_dumps, _normalize_path
+from ..exceptions import OrderBatchError
 from ..models import OrderRequest, OrderResponse
 
 
@@ -31,7 +33,10 @@ class PolymarketTradingClient(BaseAPIClient):
     ) -> None:
         super().__init__(base_url=base_url, session=session, timeout=timeout)
         self.api_key = api_key
-        self._api_secret = api_secret
+        self._secret_bytes = base64.urlsafe_b64decode(api_secret)
+        # Keyed HMAC state, copied per request so the key schedule (inner and
+        # outer pads) is derived once rather than on every signed call.
+        self._hmac_template = _hmac.new(self._secret_bytes, None, hashlib.sha256)
         self._api_passphrase = api_passphrase
         self._address = address
         # POLY_ADDRESS must be the EOA (signer) address. For proxy/email accounts
@@ -46,16 +51,57 @@ class PolymarketTradingClient(BaseAPIClient):
         post_only: bool = False,
         reduce_only: bool = False,
     ) -> OrderResponse:
-        payload = order.to_payload()
-        if post_only:
-            payload["postOnly"] = True
-        if reduce_only:
-            payload["reduceOnly"] = True
-        ctx = RequestContext(method="POST", path="/orders", body=payload, params=None)
-        response = self._signed_request(ctx)
-        order_id = response.get("orderId") or response.get("id") or ""
-        status = response.get("status", "submitted")
-        return OrderResponse(order_id=order_id, status=status, raw=response)
+        ctx = self._order_context(order, post_only=post_only, reduce_only=reduce_only)
+        return self._order_response(self._signed_request(ctx))
+
+    def place_orders(
+        self,
+        orders: Sequence[OrderRequest],
+        *,
+        post_only: bool = False,
+        reduce_only: bool = False,
+    ) -> List[OrderResponse]:
+        """
+        Submit several orders concurrently.
+
+        Every request is signed up front, then all are sent over one
+        ``httpx.AsyncClient`` so their round trips overlap.  Results are
+        returned in input order.  Every order is submitted even if some are
+        rejected; once all requests have completed, any failure raises
+        :class:`~polyautomate.exceptions.OrderBatchError`, whose ``results``
+        still carry the responses of the accepted orders.  Requires
+        ``httpx``.  Must not be called from a running event loop — await
+        :meth:`aplace_orders` there instead.
+        """
+        return asyncio.run(self.aplace_orders(orders, post_only=post_only, reduce_only=reduce_only))
+
+    async def aplace_orders(
+        self,
+        orders: Sequence[OrderRequest],
+        *,
+        post_only: bool = False,
+        reduce_only: bool = False,
+    ) -> List[OrderResponse]:
+        """Async variant of :meth:`place_orders`."""
+        contexts = [
+            self._order_context(order, post_only=post_only, reduce_only=reduce_only) for order in orders
+        ]
+        signed = [self._sign(ctx) for ctx in contexts]
+        async with self._async_client() as client:
+            results = await asyncio.gather(
+                *(self._arequest(client, ctx, headers=headers) for ctx, headers in signed),
+                return_exceptions=True,
+            )
+        for result in results:
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result  # cancellation / interrupt, not an order failure
+        responses = [
+            result if isinstance(result, BaseException) else self._order_response(result)
+            for result in results
+        ]
+        if any(isinstance(r, BaseException) for r in responses):
+            raise OrderBatchError(responses)
+        return responses
 
     def cancel_order(self, order_id: str) -> Dict[str, Any]:
         ctx = RequestContext(method="DELETE", path=f"/orders/{order_id}", body=None, params=None)
@@ -74,26 +120,49 @@ class PolymarketTradingClient(BaseAPIClient):
         payload = self._signed_request(ctx)
         return payload or {}
 
+    @staticmethod
+    def _order_context(order: OrderRequest, *, post_only: bool, reduce_only: bool) -> RequestContext:
+        payload = order.to_payload()
+        if post_only:
+            payload["postOnly"] = True
+        if reduce_only:
+            payload["reduceOnly"] = True
+        return RequestContext(method="POST", path="/orders", body=payload, params=None)
+
+    @staticmethod
+    def _order_response(response: Dict[str, Any]) -> OrderResponse:
+        order_id = response.get("orderId") or response.get("id") or ""
+        status = response.get("status", "submitted")
+        return OrderResponse(order_id=order_id, status=status, raw=response)
+
     def _signed_request(self, ctx: RequestContext) -> Any:
+        ctx, headers = self._sign(ctx)
+        return self._request(ctx, headers=headers)
+
+    def _sign(self, ctx: RequestContext) -> Tuple[RequestContext, Dict[str, str]]:
+        """
+        Return *ctx* with its body serialised into ``body_bytes`` and the L2
+        auth headers signing that body, so it is encoded exactly once.
+        """
         path = _normalize_path(ctx.path)
         timestamp = str(int(time.time()))
-        body_str = _json_dumps(ctx.body)
 
         # Build the message: timestamp + method + path + body (body omitted if empty)
-        message = f"{timestamp}{ctx.method.upper()}{path}"
-        if body_str:
-            message += body_str.replace("'", '"')
+        message = f"{timestamp}{ctx.method.upper()}{path}".encode("utf-8")
+        if ctx.body:
+            # _json_dumps escapes non-ASCII, so its output is already ASCII.
+            body_bytes = _json_dumps(ctx.body).encode("ascii")
+            message += body_bytes.replace(b"'", b'"')
+            ctx = ctx._replace(body_bytes=body_bytes)
 
-        secret_bytes = base64.urlsafe_b64decode(self._api_secret)
-        sig = base64.urlsafe_b64encode(
-            _hmac.new(secret_bytes, message.encode("utf-8"), hashlib.sha256).digest()
-        ).decode("utf-8")
+        mac = self._hmac_template.copy()
+        mac.update(message)
+        sig = base64.urlsafe_b64encode(mac.digest()).decode("ascii")
 
-        headers = {
+        return ctx, {
             "POLY_ADDRESS": self._signer_address,
             "POLY_SIGNATURE": sig,
             "POLY_TIMESTAMP": timestamp,
             "POLY_API_KEY": self.api_key,
             "POLY_PASSPHRASE": self._api_passphrase,
         }
-        return self._request(ctx, headers=headers)
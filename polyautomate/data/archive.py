@@ -4,6 +4,9 @@ Helpers for building local archives of Polymarket market history.
 
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterable, List, Optional, Sequence
@@ -32,6 +35,12 @@ class ExportSummary:
     failed_markets: List[CatalogMarket] = field(default_factory=list)
 
 
+# Maps every ASCII character that is not alphanumeric, "-" or "_" to "_".
+_SANITIZE_TABLE = str.maketrans(
+    {c: "_" for c in map(chr, range(128)) if not (c.isalnum() or c in "-_")}
+)
+
+
 class MarketHistoryExporter:
     """
     Collects price history for catalogue markets and persists it to CSV files.
@@ -55,6 +64,9 @@ class MarketHistoryExporter:
         self.history_service = history_service or PriceHistoryService()
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        # Catalogue events by slug (None when the lookup failed); sibling
+        # markets of one event share a single fetch.
+        self._events: dict[str, Optional[_EventIndex]] = {}
 
     def export_search(
         self,
@@ -66,6 +78,7 @@ class MarketHistoryExporter:
         interval: str = "1h",
         fidelity_minutes: Optional[int] = None,
         overwrite: bool = False,
+        workers: int = 1,
     ) -> ExportSummary:
         markets = self.catalog.search_markets(
             query=query,
@@ -78,6 +91,7 @@ class MarketHistoryExporter:
             interval=interval,
             fidelity_minutes=fidelity_minutes,
             overwrite=overwrite,
+            workers=workers,
         )
 
     def export_markets(
@@ -87,53 +101,97 @@ class MarketHistoryExporter:
         interval: str = "1h",
         fidelity_minutes: Optional[int] = None,
         overwrite: bool = False,
+        workers: int = 1,
     ) -> ExportSummary:
+        """
+        Export every token of *markets*.
+
+        With ``workers > 1`` markets are processed concurrently on a thread
+        pool (each one is mostly network and disk I/O); results keep the
+        order of *markets*.
+        """
+        markets = list(markets)
+        # One directory listing instead of an exists() call per token
+        existing = {entry.name for entry in os.scandir(self.output_dir)}
+        lock = threading.Lock()
+
+        def export_one(market: CatalogMarket) -> Optional[List[ExportResult]]:
+            return self._export_market(
+                market, existing, lock, interval, fidelity_minutes, overwrite
+            )
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outcomes = list(pool.map(export_one, markets))
+        else:
+            outcomes = [export_one(market) for market in markets]
+
         results: List[ExportResult] = []
-        failed = 0
         failed_markets: List[CatalogMarket] = []
-        for market in markets:
-            try:
-                enriched = self._hydrate_market(market)
-            except LookupError:
-                failed += 1
+        for market, outcome in zip(markets, outcomes):
+            if outcome is None:
                 failed_markets.append(market)
-                continue
-            if not enriched.condition_id or not enriched.clob_token_ids:
-                continue
-            for token_id in enriched.clob_token_ids:
-                history = self.history_service.get_price_history(
-                    enriched.condition_id,
-                    token_id,
-                    interval=interval,
-                    fidelity_minutes=fidelity_minutes,
-                )
-                frame = history.to_dataframe()
-                if frame.empty:
-                    continue
-                filename = self._build_filename(enriched, token_id, interval)
-                path = self.output_dir / filename
-                if not overwrite and path.exists():
-                    results.append(
-                        ExportResult(
-                            market=enriched,
-                            token_id=token_id,
-                            interval=interval,
-                            path=path,
-                            rows=len(frame),
-                        )
-                    )
-                    continue
-                frame.to_csv(path, index=True)
+            else:
+                results.extend(outcome)
+        return ExportSummary(
+            successes=results, failed=len(failed_markets), failed_markets=failed_markets
+        )
+
+    def _export_market(
+        self,
+        market: CatalogMarket,
+        existing: set[str],
+        lock: threading.Lock,
+        interval: str,
+        fidelity_minutes: Optional[int],
+        overwrite: bool,
+    ) -> Optional[List[ExportResult]]:
+        """Export one market's tokens; ``None`` when it cannot be hydrated."""
+        try:
+            enriched = self._hydrate_market(market)
+        except LookupError:
+            return None
+        results: List[ExportResult] = []
+        if not enriched.condition_id or not enriched.clob_token_ids:
+            return results
+        for token_id in enriched.clob_token_ids:
+            filename = self._build_filename(enriched, token_id, interval)
+            path = self.output_dir / filename
+            with lock:
+                skip = not overwrite and filename in existing
+            if skip:
+                # Already exported: skip the network fetch entirely
                 results.append(
                     ExportResult(
                         market=enriched,
                         token_id=token_id,
                         interval=interval,
                         path=path,
-                        rows=len(frame),
+                        rows=_count_csv_rows(path),
                     )
                 )
-        return ExportSummary(successes=results, failed=failed, failed_markets=failed_markets)
+                continue
+            history = self.history_service.get_price_history(
+                enriched.condition_id,
+                token_id,
+                interval=interval,
+                fidelity_minutes=fidelity_minutes,
+            )
+            if not history.points:
+                continue
+            rows = history.write_csv(path)
+            with lock:
+                existing.add(filename)
+            results.append(
+                ExportResult(
+                    market=enriched,
+                    token_id=token_id,
+                    interval=interval,
+                    path=path,
+                    rows=rows,
+                )
+            )
+        return results
 
     def _hydrate_market(self, market: CatalogMarket) -> CatalogMarket:
         if market.condition_id and market.clob_token_ids:
@@ -157,30 +215,73 @@ class MarketHistoryExporter:
             if not slug or slug in seen:
                 continue
             seen.add(slug)
-            try:
-                event = self.catalog.get_event(slug)
-            except ValueError:
+            index = self._get_event(slug)
+            if index is None:
                 continue
-            matched = _match_market(event, market)
+            matched = index.match(market)
             if matched:
                 return matched
         raise LookupError(f"Unable to hydrate market metadata for slug(s): {', '.join(seen) or 'unknown'}")
 
+    def _get_event(self, slug: str) -> Optional[_EventIndex]:
+        if slug not in self._events:
+            try:
+                self._events[slug] = _EventIndex(self.catalog.get_event(slug))
+            except ValueError:
+                self._events[slug] = None
+        return self._events[slug]
+
     @staticmethod
     def _build_filename(market: CatalogMarket, token_id: str, interval: str) -> str:
         base_slug = market.slug or (market.raw.get("slug") if market.raw else market.question or market.id)
-        sanitized = "".join(c if c.isalnum() or c in "-_" else "_" for c in base_slug)
+        if base_slug.isascii():
+            sanitized = base_slug.translate(_SANITIZE_TABLE)
+        else:
+            sanitized = "".join(c if c.isalnum() or c in "-_" else "_" for c in base_slug)
         return f"{sanitized}_{token_id}_{interval}.csv"
 
 
+def _count_csv_rows(path: Path) -> int:
+    """Number of data rows in a CSV written by the exporter (header excluded)."""
+    with open(path, "rb") as handle:
+        return max(sum(1 for _ in handle) - 1, 0)
+
+
+class _EventIndex:
+    """
+    Hash lookups over an event's markets, built once per event.
+
+    :meth:`match` returns the same market as scanning ``event.markets`` in
+    order and taking the first candidate that matches by id, condition id,
+    slug or question.
+    """
+
+    __slots__ = ("event", "_by_id", "_by_condition_id", "_by_slug", "_by_question")
+
+    def __init__(self, event: CatalogEvent) -> None:
+        self.event = event
+        self._by_id: dict[str, int] = {}
+        self._by_condition_id: dict[str, int] = {}
+        self._by_slug: dict[str, int] = {}
+        self._by_question: dict[str, int] = {}
+        for pos, candidate in enumerate(event.markets):
+            self._by_id.setdefault(candidate.id, pos)
+            if candidate.condition_id:
+                self._by_condition_id.setdefault(candidate.condition_id, pos)
+            if candidate.slug:
+                self._by_slug.setdefault(candidate.slug, pos)
+            self._by_question.setdefault(candidate.question, pos)
+
+    def match(self, source: CatalogMarket) -> Optional[CatalogMarket]:
+        hits = [
+            self._by_id.get(source.id),
+            self._by_condition_id.get(source.condition_id),
+            self._by_slug.get(source.slug) if source.slug else None,
+            self._by_question.get(source.question),
+        ]
+        positions = [pos for pos in hits if pos is not None]
+        return self.event.markets[min(positions)] if positions else None
+
+
 def _match_market(event: CatalogEvent, source: CatalogMarket) -> Optional[CatalogMarket]:
-    for candidate in event.markets:
-        if candidate.id == source.id:
-            return candidate
-        if candidate.condition_id and candidate.condition_id == source.condition_id:
-            return candidate
-        if candidate.slug and source.slug and candidate.slug == source.slug:
-            return candidate
-        if candidate.question == source.question:
-            return candidate
-    return None
+    return _EventIndex(event).match(source)
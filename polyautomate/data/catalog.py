@@ -5,16 +5,23 @@ and CLOB token identifiers.
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+import hashlib
 import json
+import time
 
 import requests
 
+from ..clients.base import USER_AGENT, _json_loads, get_default_session
 from ..exceptions import PolymarketAPIError
 
 CATALOG_BASE_URL = "https://gamma-api.polymarket.com"
 
+# Conditional-GET entries kept per catalogue, least recently used evicted first.
+_CONDITIONAL_CACHE_SIZE = 64
+
 
 @dataclass(slots=True)
 class CatalogMarket:
@@ -27,6 +34,7 @@ class CatalogMarket:
     enable_order_book: bool
     clob_token_ids: List[str]
     raw: Dict[str, Any]
+    tags: FrozenSet[str] = frozenset()  # lowercased ``tags``/``tag`` values
 
 
 @dataclass(slots=True)
@@ -41,22 +49,80 @@ class CatalogEvent:
 
 
 class MarketCatalog:
-    """High-level wrapper around the Gamma catalogue endpoints."""
-
-    def __init__(self, *, base_url: str = CATALOG_BASE_URL, timeout: float = 10.0) -> None:
+    """
+    High-level wrapper around the Gamma catalogue endpoints.
+
+    ``cache_ttl`` (seconds) lets repeated :meth:`search_markets` calls with
+    the same ``closed``/``limit`` reuse the last ``/markets`` listing and its
+    search index without asking the server; ``0`` (the default) always asks.
+    Either way unchanged listings are revalidated with ``ETag`` /
+    ``If-None-Match`` rather than downloaded and parsed again.
+    With ``http2=True`` requests go through an ``httpx.Client`` that
+    multiplexes them over one HTTP/2 connection (requires
+    ``httpx[http2]``).  Otherwise requests go through ``session`` or, by
+    default, the process-wide
+    :func:`~polyautomate.clients.base.get_default_session`.
+    """
+
+    def __init__(
+        self,
+        *,
+        base_url: str = CATALOG_BASE_URL,
+        timeout: float = 10.0,
+        cache_ttl: float = 0.0,
+        http2: bool = False,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
-        self.session = requests.Session()
-        self.session.headers.update({"User-Agent": "polyautomate/0.1"})
+        self.cache_ttl = cache_ttl
+        if session is not None:
+            self.session = session
+        elif http2:
+            self.session = _http2_session()
+        else:
+            self.session = get_default_session()
+        self._market_indexes: Dict[
+            Tuple[Optional[bool], Optional[int]], Tuple[float, Optional[str], _MarketIndex]
+        ] = {}
+        # Conditional-GET state per (path, params): last ETag and raw body
+        self._conditional: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+    def _get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[bytes, Optional[str]]:
+        """
+        GET *path* and return the raw body and its ``ETag``.
 
-    def _request(self, path: str, *, params: Optional[Dict[str, Any]] = None) -> Any:
+        Responses carrying an ``ETag`` are remembered per path and params (the
+        most recent :data:`_CONDITIONAL_CACHE_SIZE` of them); the next
+        identical request sends ``If-None-Match`` and, on ``304 Not
+        Modified``, reuses the stored body without transferring it again.
+        """
         url = f"{self.base_url}{path}"
-        response = self.session.get(url, params=params, timeout=self.timeout)
+        key = _request_key(path, params)
+        cached = self._conditional.get(key)
+        headers = {"If-None-Match": cached[0]} if cached is not None else None
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached is not None:
+            self._conditional.move_to_end(key)
+            return cached[1], cached[0]
         if response.status_code >= 400:
-            raise PolymarketAPIError(response.status_code, response.text or response.reason)
-        if not response.content:
-            return None
-        return response.json()
+            reason = getattr(response, "reason", None) or getattr(response, "reason_phrase", "")
+            raise PolymarketAPIError(response.status_code, response.text or reason)
+        body = response.content or b""
+        etag = response.headers.get("ETag")
+        if etag:
+            self._conditional[key] = (etag, body)
+            self._conditional.move_to_end(key)
+            if len(self._conditional) > _CONDITIONAL_CACHE_SIZE:
+                self._conditional.popitem(last=False)
+        else:
+            self._conditional.pop(key, None)
+        return body, etag
+
+    def _request(self, path: str, *, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET *path* and decode the JSON body; every call returns a fresh object."""
+        body, _ = self._get(path, params)
+        return _json_loads(body) if body else None
 
     def search_markets(
         self,
@@ -71,28 +137,32 @@ class MarketCatalog:
 
         The server currently ignores `tag`, so the filter is applied client-side.
         """
+        index = self._market_index(closed, limit)
+        markets = index.search(query) if query else list(index.markets)
+        if tag:
+            tag_lower = tag.lower()
+            markets = [m for m in markets if tag_lower in m.tags]
+        return markets
+
+    def _market_index(self, closed: Optional[bool], limit: Optional[int]) -> "_MarketIndex":
+        key = (closed, limit)
+        now = time.monotonic()
+        cached = self._market_indexes.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            return cached[2]
         params: Dict[str, Any] = {}
         if closed is not None:
             params["closed"] = json.dumps(closed)
         if limit is not None:
             params["limit"] = limit
-        payload = self._request("/markets", params=params or None) or []
-        markets = [_to_catalog_market(item) for item in payload]
-        if query:
-            lowered = query.lower()
-            markets = [
-                m
-                for m in markets
-                if lowered in m.question.lower() or lowered in (m.slug.lower() if m.slug else "")
-            ]
-        if tag:
-            tag_lower = tag.lower()
-            markets = [
-                m
-                for m in markets
-                if _has_tag(m.raw, tag_lower)
-            ]
-        return markets
+        body, etag = self._get("/markets", params or None)
+        if cached is not None and etag is not None and cached[1] == etag:
+            index = cached[2]  # same ETag (e.g. 304 Not Modified): the listing is unchanged
+        else:
+            payload = (_json_loads(body) if body else None) or []
+            index = _MarketIndex([_to_catalog_market(item) for item in payload])
+        self._market_indexes[key] = (now, etag, index)
+        return index
 
     def get_event(self, slug: str) -> CatalogEvent:
         payload = self._request("/events", params={"slug": slug})
@@ -110,12 +180,50 @@ class MarketCatalog:
         )
 
 
+def _request_key(path: str, params: Optional[Dict[str, Any]]) -> str:
+    raw = json.dumps([path, params or {}], sort_keys=True, default=str)
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _http2_session() -> Any:
+    """``httpx.Client`` over HTTP/2; covers the ``requests.Session`` calls made here."""
+    try:
+        import httpx
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise ImportError(
+            "httpx is required for http2=True. Install it with 'pip install httpx[http2]'."
+        ) from exc
+    return httpx.Client(http2=True, headers={"User-Agent": USER_AGENT})
+
+
+class _MarketIndex:
+    """
+    A ``/markets`` listing with its lowercased search keys, built once so
+    repeated queries do not re-lowercase every question and slug.
+    """
+
+    __slots__ = ("markets", "_questions", "_slugs")
+
+    def __init__(self, markets: List[CatalogMarket]) -> None:
+        self.markets = markets
+        self._questions = [m.question.lower() for m in markets]
+        self._slugs = [m.slug.lower() if m.slug else "" for m in markets]
+
+    def search(self, query: str) -> List[CatalogMarket]:
+        lowered = query.lower()
+        return [
+            m
+            for m, question, slug in zip(self.markets, self._questions, self._slugs)
+            if lowered in question or lowered in slug
+        ]
+
+
 def _to_catalog_market(payload: Dict[str, Any]) -> CatalogMarket:
     ids_raw = payload.get("clobTokenIds") or "[]"
     if isinstance(ids_raw, str):
         try:
-            clob_ids = json.loads(ids_raw)
-        except json.JSONDecodeError:
+            clob_ids = _json_loads(ids_raw)
+        except ValueError:
             clob_ids = []
     elif isinstance(ids_raw, list):
         clob_ids = ids_raw
@@ -129,21 +237,15 @@ def _to_catalog_market(payload: Dict[str, Any]) -> CatalogMarket:
         enable_order_book=bool(payload.get("enableOrderBook")),
         clob_token_ids=[str(token) for token in clob_ids],
         raw=payload,
+        tags=_tag_set(payload),
     )
 
 
-def _has_tag(raw: Dict[str, Any], tag_lower: str) -> bool:
-    if not raw:
-        return False
-    tags_value = raw.get("tags")
-    single_tag = raw.get("tag")
+def _tag_set(raw: Dict[str, Any]) -> FrozenSet[str]:
     candidates: List[str] = []
-    if isinstance(tags_value, list):
-        candidates.extend(str(item) for item in tags_value)
-    elif isinstance(tags_value, str):
-        candidates.append(tags_value)
-    if isinstance(single_tag, list):
-        candidates.extend(str(item) for item in single_tag)
-    elif isinstance(single_tag, str):
-        candidates.append(single_tag)
-    return any(tag_lower == candidate.lower() for candidate in candidates)
+    for value in (raw.get("tags"), raw.get("tag")):
+        if isinstance(value, list):
+            candidates.extend(str(item) for item in value)
+        elif isinstance(value, str):
+            candidates.append(value)
+    return frozenset(candidate.lower() for candidate in candidates)
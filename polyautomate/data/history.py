@@ -4,12 +4,31 @@ Utilities for retrieving and shaping Polymarket price history.
 
 from __future__ import annotations
 
+import csv
 from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
 from typing import Iterable, List, Sequence
 
 from ..clients.data import PolymarketDataClient
 from ..models import PricePoint
 
+try:  # Arrow's C++ CSV writer for large exports
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+# Below this many rows the stdlib csv module beats pyarrow's per-call setup.
+_ARROW_MIN_ROWS = 10_000
+
+
+def _csv_timestamp(value: datetime) -> str:
+    # Same text DataFrame.to_csv writes for a UTC DatetimeIndex.
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat(sep=" ")
+
 
 @dataclass(slots=True)
 class PriceHistory:
@@ -35,16 +54,37 @@ class PriceHistory:
                 "pandas is required for to_dataframe(). Install it with 'pip install pandas'."
             ) from exc
 
-        rows = self.to_rows()
-        if not rows:
+        if not self.points:
             return pd.DataFrame(columns=["price"]).set_index(
                 pd.Index([], name="timestamp")
             )
-        frame = pd.DataFrame(rows)
-        frame["timestamp"] = pd.to_datetime(frame["timestamp"], utc=True)
-        frame = frame.set_index("timestamp").sort_index()
-        frame.index.name = "timestamp"
-        return frame
+        # Build the columns directly rather than going through per-row dicts
+        index = pd.DatetimeIndex(
+            pd.to_datetime([point.timestamp for point in self.points], utc=True),
+            name="timestamp",
+        )
+        frame = pd.DataFrame({"price": [float(point.price) for point in self.points]}, index=index)
+        return frame.sort_index()
+
+    def write_csv(self, path: str | Path) -> int:
+        """
+        Write ``timestamp,price`` rows sorted by time, without pandas.
+
+        Produces the same layout as ``to_dataframe().to_csv(path)``.  Returns
+        the number of rows written.
+        """
+        points = sorted(self.points, key=lambda point: point.timestamp)
+        timestamps = [_csv_timestamp(point.timestamp) for point in points]
+        prices = [float(point.price) for point in points]
+        if pa is not None and len(points) >= _ARROW_MIN_ROWS:
+            table = pa.table({"timestamp": timestamps, "price": prices})
+            pa_csv.write_csv(table, str(path), pa_csv.WriteOptions(quoting_style="none"))
+            return len(points)
+        with open(path, "w", newline="") as handle:
+            writer = csv.writer(handle, lineterminator="\n")
+            writer.writerow(("timestamp", "price"))
+            writer.writerows(zip(timestamps, prices))
+        return len(points)
 
     @property
     def candles(self) -> Sequence[PricePoint]:
@@ -6,3 +6,32 @@ class PolymarketAPIError(RuntimeError):
         super().__init__(detail)
         self.status_code = status_code
         self.payload = payload or {}
+
+
+class OrderBatchError(PolymarketAPIError):
+    """
+    Raised by ``place_orders`` when at least one order of a batch failed.
+
+    ``results`` has one entry per submitted order, in input order: the
+    ``OrderResponse`` of each accepted order and the exception of each failed
+    one, so callers can tell which orders are live.  ``status_code`` and
+    ``payload`` are taken from the first failure.
+    """
+
+    def __init__(self, results: list):
+        errors = [r for r in results if isinstance(r, BaseException)]
+        first = errors[0]
+        super().__init__(
+            getattr(first, "status_code", 0),
+            f"{len(errors)} of {len(results)} orders failed; first: {first}",
+            payload=getattr(first, "payload", None),
+        )
+        self.results = results
+
+    @property
+    def errors(self) -> list:
+        return [r for r in self.results if isinstance(r, BaseException)]
+
+    @property
+    def responses(self) -> list:
+        return [r for r in self.results if not isinstance(r, BaseException)]
@@ -4,35 +4,101 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any, Dict, Optional, Sequence
-import secrets
+import os
+import re
+import threading
 
 
 OrderSide = str  # accepted values: "buy" or "sell"
 
 
+_SALT_BYTES = 16
+_SALT_BUFFER = bytearray()
+_SALT_LOCK = threading.Lock()
+
+
+def _gen_salt() -> str:
+    """Return 16 random bytes as hex, drawing from the OS in 256-byte batches."""
+    with _SALT_LOCK:
+        if len(_SALT_BUFFER) < _SALT_BYTES:
+            _SALT_BUFFER.extend(os.urandom(256))
+        out = bytes(_SALT_BUFFER[:_SALT_BYTES])
+        del _SALT_BUFFER[:_SALT_BYTES]
+    return out.hex()
+
+
+def _reset_salt_buffer() -> None:
+    # A forked child must not hand out the parent's remaining salts, nor
+    # inherit the lock in a held state.
+    global _SALT_LOCK
+    _SALT_LOCK = threading.Lock()
+    _SALT_BUFFER.clear()
+
+
+os.register_at_fork(after_in_child=_reset_salt_buffer)
+
+
+_TS_KEYS = ("timestamp", "time", "ts", "t")
+_PRICE_KEYS = ("price", "value", "close", "p")
+
+
 def _ensure_decimal(value: Decimal | float | int | str) -> Decimal:
     if isinstance(value, Decimal):
         return value
     return Decimal(str(value))
 
 
+# Plain decimal strings that str(Decimal(s)) returns unchanged (no exponent
+# notation, which Decimal switches to below 1e-6)
+_DECIMAL_STR_RE = re.compile(r"-?(?:[1-9][0-9]*(?:\.[0-9]+)?|0(?:\.[0-9]{1,6})?)")
+
+
+def _decimal_str(value: Decimal | float | int | str) -> str:
+    if isinstance(value, str) and _DECIMAL_STR_RE.fullmatch(value):
+        return value
+    return str(_ensure_decimal(value))
+
+
 def _ensure_datetime(value: datetime | int | float) -> datetime:
     if isinstance(value, datetime):
         return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
     return datetime.fromtimestamp(float(value), tz=timezone.utc)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class OrderRequest:
-    """Represents the minimal payload needed to submit an order to the CLOB API."""
+    """
+    Represents the minimal payload needed to submit an order to the CLOB API.
+
+    Side, price, size and expiration are validated and normalised once at
+    construction, so :meth:`to_payload` only assembles the dict.  Instances
+    are frozen so those cached values cannot go stale; use
+    :func:`dataclasses.replace` to derive a modified order.
+    """
 
     token_id: str
     side: OrderSide
     price: Decimal | float | int | str
     size: Decimal | float | int | str
     expiration: datetime | int | float
-    salt: str = field(default_factory=lambda: secrets.token_hex(16))
+    salt: str = field(default_factory=_gen_salt)
     client_order_id: Optional[str] = None
+    _side: str = field(init=False, repr=False, compare=False)
+    _price_str: str = field(init=False, repr=False, compare=False)
+    _size_str: str = field(init=False, repr=False, compare=False)
+    _expiration_ts: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        expiration = self.expiration
+        if isinstance(expiration, (int, float)):
+            expiration_ts = int(expiration)
+        else:
+            expiration_ts = int(_ensure_datetime(expiration).timestamp())
+        set_ = object.__setattr__
+        set_(self, "_side", self.normalized_side())
+        set_(self, "_price_str", _decimal_str(self.price))
+        set_(self, "_size_str", _decimal_str(self.size))
+        set_(self, "_expiration_ts", expiration_ts)
 
     def normalized_side(self) -> str:
         value = self.side.lower()
@@ -41,13 +107,12 @@ class OrderRequest:
         return value
 
     def to_payload(self) -> Dict[str, Any]:
-        expiration_ts = int(_ensure_datetime(self.expiration).timestamp())
         payload: Dict[str, Any] = {
             "tokenId": self.token_id,
-            "side": self.normalized_side(),
-            "price": str(_ensure_decimal(self.price)),
-            "size": str(_ensure_decimal(self.size)),
-            "expiration": expiration_ts,
+            "side": self._side,
+            "price": self._price_str,
+            "size": self._size_str,
+            "expiration": self._expiration_ts,
             "salt": self.salt,
         }
         if self.client_order_id:
@@ -74,19 +139,12 @@ class PricePoint:
     @classmethod
     def from_api(cls, data: Any) -> "PricePoint":
         if isinstance(data, dict):
-            ts = (
-                data.get("timestamp")
-                or data.get("time")
-                or data.get("ts")
-                or data.get("t")
-            )
-            price = (
-                data.get("price")
-                or data.get("value")
-                or data.get("close")
-                or data.get("p")
-            )
-        elif isinstance(data, Sequence) and len(data) >= 2:
+            # First non-null value, so a legitimate 0 timestamp/price is kept.
+            ts = next((v for k in _TS_KEYS if (v := data.get(k)) is not None), None)
+            price = next((v for k in _PRICE_KEYS if (v := data.get(k)) is not None), None)
+        elif isinstance(data, Sequence) and not isinstance(data, (str, bytes)):
+            if len(data) < 2:
+                raise ValueError(f"Unsupported price history entry: {data!r}")
             ts, price = data[0], data[1]
         else:
             raise ValueError(f"Unsupported price history entry: {data!r}")
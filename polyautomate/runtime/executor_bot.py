@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import importlib
 import json
 import logging
+import multiprocessing
 import os
-import time
-from contextlib import contextmanager
+import signal
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from typing import Callable
 
 
@@ -25,22 +28,6 @@ def _load_runner(path: str) -> Callable[[], int]:
     return fn
 
 
-@contextmanager
-def _temporary_env(overrides: dict[str, str]):
-    original: dict[str, str | None] = {}
-    try:
-        for key, value in overrides.items():
-            original[key] = os.environ.get(key)
-            os.environ[key] = value
-        yield
-    finally:
-        for key, old in original.items():
-            if old is None:
-                os.environ.pop(key, None)
-            else:
-                os.environ[key] = old
-
-
 def _load_shadow_overrides() -> dict[str, str]:
     raw = os.getenv("SHADOW_ENV_OVERRIDES_JSON", "").strip()
     if not raw:
@@ -56,40 +43,128 @@ def _load_shadow_overrides() -> dict[str, str]:
     return {str(k): str(v) for k, v in payload.items()}
 
 
-def main() -> None:
+_SHADOW_RUNNER: Callable[[], int] | None = None
+
+
+def _init_shadow_worker(runner_path: str, env: dict[str, str]) -> None:
+    # The shadow runner lives in its own process so its env overrides never
+    # leak into the primary runner, which reads os.environ concurrently.
+    global _SHADOW_RUNNER
+    os.environ.update(env)
+    _SHADOW_RUNNER = _load_runner(runner_path)
+
+
+def _run_shadow_cycle() -> int:
+    assert _SHADOW_RUNNER is not None
+    return int(_SHADOW_RUNNER())
+
+
+async def _primary_cycle(loop: asyncio.AbstractEventLoop, run_once: Callable[[], int], dry_run: bool) -> int | None:
+    """Run one primary cycle; returns the action count, or None if it failed."""
+    try:
+        action_count = int(await loop.run_in_executor(None, run_once))
+        if action_count > 0:
+            LOGGER.info("ACTION_EXECUTED count=%s dry_run=%s", action_count, dry_run)
+        else:
+            LOGGER.info("cycle_complete count=0")
+        return action_count
+    except Exception:
+        LOGGER.exception("executor_cycle_failed")
+        return None
+
+
+def _next_delay(poll_seconds: int, max_poll_seconds: int, idle_cycles: int) -> int:
+    """Double the poll interval per consecutive idle cycle, up to *max_poll_seconds*."""
+    if idle_cycles <= 0:
+        return poll_seconds
+    return max(poll_seconds, min(poll_seconds * 2 ** min(idle_cycles, 5), max_poll_seconds))
+
+
+async def _shadow_cycle(loop: asyncio.AbstractEventLoop, pool: ProcessPoolExecutor, dry_run: bool) -> bool:
+    """Run one shadow cycle; returns False if the shadow process died."""
+    try:
+        shadow_count = await loop.run_in_executor(pool, _run_shadow_cycle)
+        LOGGER.info("shadow_cycle_complete count=%s dry_run=%s", shadow_count, dry_run)
+    except BrokenProcessPool:
+        LOGGER.exception("shadow_process_died")
+        return False
+    except Exception:
+        LOGGER.exception("shadow_cycle_failed")
+    return True
+
+
+async def main_async() -> None:
     runner_path = os.getenv("STRATEGY_RUNNER", "polyautomate.runtime.example_strategy:run_once")
     shadow_runner_path = os.getenv("SHADOW_STRATEGY_RUNNER", "").strip()
     poll_seconds = int(os.getenv("POLL_SECONDS", "30"))
+    # Idle backoff is opt-in: the cap defaults to the base interval.
+    max_poll_seconds = int(os.getenv("MAX_POLL_SECONDS", str(poll_seconds)))
     dry_run = os.getenv("DRY_RUN", "1") == "1"
     shadow_dry_run = os.getenv("SHADOW_DRY_RUN", "1") == "1"
     shadow_overrides = _load_shadow_overrides()
 
     run_once = _load_runner(runner_path)
-    run_shadow_once = _load_runner(shadow_runner_path) if shadow_runner_path else None
     LOGGER.info("executor started runner=%s dry_run=%s", runner_path, dry_run)
-    if run_shadow_once:
+
+    shadow_env = {"DRY_RUN": "1" if shadow_dry_run else "0"}
+    shadow_env.update(shadow_overrides)
+
+    def start_shadow() -> ProcessPoolExecutor:
+        # Spawn rather than fork: forking while the primary thread is
+        # mid-request would hand the child copies of its live HTTP sessions.
+        return ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_shadow_worker,
+            initargs=(shadow_runner_path, shadow_env),
+        )
+
+    shadow_pool = start_shadow() if shadow_runner_path else None
+    if shadow_pool is not None:
         LOGGER.info("shadow started runner=%s dry_run=%s", shadow_runner_path, shadow_dry_run)
 
-    while True:
+    loop = asyncio.get_running_loop()
+    # SIGTERM / SIGINT end the current wait immediately instead of after a
+    # (possibly backed-off) full poll interval.
+    stop = asyncio.Event()
+    for sig in (signal.SIGTERM, signal.SIGINT):
         try:
-            action_count = int(run_once())
-            if action_count > 0:
-                LOGGER.info("ACTION_EXECUTED count=%s dry_run=%s", action_count, dry_run)
-            else:
-                LOGGER.info("cycle_complete count=0")
-        except Exception:
-            LOGGER.exception("executor_cycle_failed")
+            loop.add_signal_handler(sig, stop.set)
+        except (NotImplementedError, RuntimeError):  # pragma: no cover - non-POSIX / not main thread
+            pass
 
-        if run_shadow_once:
+    idle_cycles = 0
+    try:
+        while not stop.is_set():
+            # Primary and shadow cycles run side by side; the shadow's env
+            # overrides are confined to its own process.
+            if shadow_pool is None:
+                action_count = await _primary_cycle(loop, run_once, dry_run)
+            else:
+                action_count, shadow_alive = await asyncio.gather(
+                    _primary_cycle(loop, run_once, dry_run),
+                    _shadow_cycle(loop, shadow_pool, shadow_dry_run),
+                )
+                if not shadow_alive:
+                    shadow_pool.shutdown(wait=False)
+                    shadow_pool = start_shadow()
+            # Back off while the primary runner finds nothing to do; a failed
+            # cycle is retried at the base interval rather than counted as idle.
+            idle_cycles = idle_cycles + 1 if action_count == 0 else 0
             try:
-                env = {"DRY_RUN": "1" if shadow_dry_run else "0"}
-                env.update(shadow_overrides)
-                with _temporary_env(env):
-                    shadow_count = int(run_shadow_once())
-                LOGGER.info("shadow_cycle_complete count=%s dry_run=%s", shadow_count, shadow_dry_run)
-            except Exception:
-                LOGGER.exception("shadow_cycle_failed")
-        time.sleep(poll_seconds)
+                await asyncio.wait_for(
+                    stop.wait(), timeout=_next_delay(poll_seconds, max_poll_seconds, idle_cycles)
+                )
+            except asyncio.TimeoutError:
+                pass
+        LOGGER.info("executor stopping")
+    finally:
+        if shadow_pool is not None:
+            shadow_pool.shutdown(wait=False, cancel_futures=True)
+
+
+def main() -> None:
+    asyncio.run(main_async())
 
 
 if __name__ == "__main__":
@@ -6,13 +6,26 @@ import hmac as _hmac
 import json
 import logging
 import os
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from operator import attrgetter
 from pathlib import Path
+from typing import Iterator
 
 import requests
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX
+    fcntl = None
+
+from polyautomate.clients.base import _json_loads, orjson
 from polyautomate.clients.polymarketdata import PMDClient, PMDError
 from polyautomate.clients.trading import PolymarketTradingClient
 from polyautomate.models import OrderRequest
@@ -41,8 +54,23 @@ _SPORTS_KEYWORDS = (
     "spread:",
 )
 
+# Outcome labels as the API normally spells them -> normalised form
+_OUTCOME_LABELS = {"Yes": "yes", "No": "no", "YES": "yes", "NO": "no", "yes": "yes", "no": "no"}
+
+# Default concurrent per-market price/metrics requests in _scan_candidates
+# (LONGSHOT_SCAN_WORKERS); kept low to stay clear of API rate limits.
+_SCAN_WORKERS = 4
+
+# One alternation over all keywords: a single scan of the question per call
+_SPORTS_RE = re.compile("|".join(re.escape(kw) for kw in _SPORTS_KEYWORDS))
+
+
+# One PMDClient per API key, kept across cycles so its keep-alive pool stays warm
+_PMD_CLIENTS: dict[str, PMDClient] = {}
+_PMD_CLIENTS_LOCK = threading.Lock()
+
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Candidate:
     slug: str
     question: str
@@ -55,7 +83,7 @@ class Candidate:
     rel_spread: float
 
 
-@dataclass
+@dataclass(slots=True)
 class SizingDecision:
     size: float
     notional_usd: float
@@ -66,33 +94,67 @@ class SizingDecision:
 
 
 def _is_sports_market(question: str) -> bool:
-    q = question.lower()
-    return any(kw in q for kw in _SPORTS_KEYWORDS)
+    return _SPORTS_RE.search(question.lower()) is not None
 
 
 def _parse_dt(raw: object) -> datetime | None:
     if not raw:
         return None
+    return _parse_iso(raw if isinstance(raw, str) else str(raw))
+
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime | None:
+    # Many markets share an end date, so repeat parses are cached.
+    if value.endswith("Z"):  # fromisoformat only accepts "Z" from 3.11
+        value = value[:-1] + "+00:00"
     try:
-        dt = datetime.fromisoformat(str(raw).replace("Z", "+00:00"))
-        return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+        dt = datetime.fromisoformat(value)
     except ValueError:
         return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+def _shared_pmd_client(api_key: str) -> PMDClient:
+    with _PMD_CLIENTS_LOCK:
+        client = _PMD_CLIENTS.get(api_key)
+        if client is None:
+            client = _PMD_CLIENTS[api_key] = PMDClient(api_key=api_key)
+        return client
 
 
 def _load_state(path: Path) -> dict:
     if not path.exists():
         return {"traded": {}}
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return _json_loads(path.read_bytes())
     except Exception:
         LOGGER.exception("state_load_failed path=%s", path)
         return {"traded": {}}
 
 
-def _save_state(path: Path, state: dict) -> None:
+def _dump_state(state: dict) -> bytes:
+    if orjson is not None:
+        try:
+            return orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        except TypeError:
+            pass  # e.g. non-str keys or >64-bit ints, which stdlib accepts
+    return json.dumps(state, indent=2, sort_keys=True).encode()
+
+
+def _save_state(path: Path, state: dict, snapshot: bytes | None = None) -> None:
+    """Write *state* atomically, skipping the write if it still serialises to *snapshot*."""
+    blob = _dump_state(state)
+    if blob == snapshot:
+        return
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding="utf-8")
+    # Write-then-rename so a crash mid-write never leaves a torn state file.
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(blob)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
 
 
 def _normalize_state(state: dict) -> dict:
@@ -186,26 +248,29 @@ def _evaluate_guardrail(state: dict, now: datetime) -> str | None:
 
 
 def _extract_token_ids(market: dict) -> tuple[str | None, str | None]:
-    yes_token = None
-    no_token = None
-    for token in market.get("tokens", []) or []:
+    found: dict[str, str] = {}
+    for token in market.get("tokens") or ():
         if not isinstance(token, dict):
             continue
-        token_id = token.get("token_id") or token.get("tokenId")
-        label = str(token.get("outcome") or token.get("label") or token.get("name") or "").strip().lower()
+        get = token.get
+        token_id = get("token_id") or get("tokenId")
         if not isinstance(token_id, str) or not token_id:
             continue
-        if label == "yes":
-            yes_token = token_id
-        elif label == "no":
-            no_token = token_id
-    return yes_token, no_token
+        label = get("outcome") or get("label") or get("name") or ""
+        if isinstance(label, str) and label in _OUTCOME_LABELS:
+            label = _OUTCOME_LABELS[label]
+        else:
+            label = str(label).strip().lower()
+        if label in ("yes", "no"):
+            found[label] = token_id
+    return found.get("yes"), found.get("no")
 
 
 def _latest_price(points: list[dict]) -> float | None:
     if not points:
         return None
-    raw = points[-1].get("p") or points[-1].get("price")
+    last = points[-1]
+    raw = last.get("p") or last.get("price")
     try:
         return float(raw)
     except (TypeError, ValueError):
@@ -225,14 +290,19 @@ def _scan_candidates(
     max_spread: float,
     max_rel_spread: float,
     open_positions: dict,
+    workers: int = _SCAN_WORKERS,
 ) -> list[Candidate]:
     start = now - timedelta(minutes=lookback_minutes)
-    candidates: list[Candidate] = []
+    start_iso = start.isoformat()
+    now_iso = now.isoformat()
 
+    # Metadata-only filters first; the per-market price/metrics requests
+    # for the survivors are then issued concurrently.
+    prefiltered: list[tuple[str, str, str, str, datetime | None]] = []
     for market in client.list_markets(
         sort="updated_at",
         order="desc",
-        end_date_min=now.isoformat(),
+        end_date_min=now_iso,
         limit=market_limit,
     ):
         if str(market.get("status", "")).lower() in {"closed", "resolved"}:
@@ -254,17 +324,21 @@ def _scan_candidates(
                 continue
 
         slug = str(market.get("slug") or market.get("id") or "")
-        if not slug:
+        if not slug or slug in open_positions:
             continue
 
         yes_token_id, no_token_id = _extract_token_ids(market)
         if not yes_token_id or not no_token_id:
             continue
 
+        prefiltered.append((slug, question, yes_token_id, no_token_id, end_date))
+
+    def evaluate(entry: tuple[str, str, str, str, datetime | None]) -> Candidate | None:
+        slug, question, yes_token_id, no_token_id, end_date = entry
         try:
-            prices = client.get_prices(slug, start.isoformat(), now.isoformat(), resolution="10m")
+            prices = client.get_prices(slug, start_iso, now_iso, resolution="10m")
         except PMDError:
-            continue
+            return None
 
         yes_points = prices.get("Yes") or prices.get("YES") or []
         no_points = prices.get("No") or prices.get("NO") or []
@@ -272,49 +346,51 @@ def _scan_candidates(
         yes_price = _latest_price(yes_points)
         no_price = _latest_price(no_points)
         if yes_price is None or no_price is None:
-            continue
+            return None
         if yes_price < min_price or yes_price > max_price:
-            continue
+            return None
         if yes_price > longshot_threshold:
-            continue
-        if slug in open_positions:
-            continue
+            return None
 
         avg_spread = 0.0
         rel_spread = 0.0
         try:
-            metrics = client.get_metrics(slug, start.isoformat(), now.isoformat(), resolution="10m")
+            metrics = client.get_metrics(slug, start_iso, now_iso, resolution="10m")
             spreads = [float(m["spread"]) for m in metrics if "spread" in m and m.get("spread") is not None]
             if spreads:
                 avg_spread = sum(spreads) / len(spreads)
         except PMDError:
-            continue
+            return None
 
         denom = min(yes_price, 1.0 - yes_price)
         if denom <= 0:
-            continue
+            return None
         rel_spread = avg_spread / denom
 
         if avg_spread > max_spread:
-            continue
+            return None
         if rel_spread > max_rel_spread:
-            continue
+            return None
 
-        candidates.append(
-            Candidate(
-                slug=slug,
-                question=question,
-                yes_token_id=yes_token_id,
-                no_token_id=no_token_id,
-                yes_price=yes_price,
-                no_price=no_price,
-                end_date=end_date,
-                avg_spread=avg_spread,
-                rel_spread=rel_spread,
-            )
+        return Candidate(
+            slug=slug,
+            question=question,
+            yes_token_id=yes_token_id,
+            no_token_id=no_token_id,
+            yes_price=yes_price,
+            no_price=no_price,
+            end_date=end_date,
+            avg_spread=avg_spread,
+            rel_spread=rel_spread,
         )
 
-    candidates.sort(key=lambda c: c.yes_price)
+    if not prefiltered:
+        return []
+    # map() keeps market order, so ties in the sort below resolve as before.
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(prefiltered)))) as pool:
+        candidates = [c for c in pool.map(evaluate, prefiltered) if c is not None]
+
+    candidates.sort(key=attrgetter("yes_price"))
     return candidates
 
 
@@ -478,7 +554,31 @@ def _compute_order_size(
     )
 
 
+@contextmanager
+def _state_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive lock on *path*'s sidecar ``.lock`` file."""
+    if fcntl is None:  # pragma: no cover - non-POSIX
+        yield
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path.with_suffix(path.suffix + ".lock"), "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
 def run_once() -> int:
+    state_path = Path(os.getenv("LONGSHOT_STATE_PATH", "/var/lib/polyautomate/longshot-state.json"))
+    # The executor's shadow runner may run this same cycle concurrently in
+    # another process; cycles sharing a state file are serialised so neither
+    # overwrites positions the other has just recorded.
+    with _state_lock(state_path):
+        return _run_cycle(state_path)
+
+
+def _run_cycle(state_path: Path) -> int:
     pmd_api_key = os.getenv("POLYMARKETDATA_API_KEY", "")
     pm_api_key = os.getenv("POLYMARKET_API_KEY", "")
     pm_signing_key = os.getenv("POLYMARKET_SIGNING_KEY", "")
@@ -493,8 +593,9 @@ def run_once() -> int:
         return 0
 
     now = datetime.now(timezone.utc)
-    state_path = Path(os.getenv("LONGSHOT_STATE_PATH", "/var/lib/polyautomate/longshot-state.json"))
-    state = _normalize_state(_load_state(state_path))
+    loaded_state = _load_state(state_path)
+    state_snapshot = _dump_state(loaded_state)
+    state = _normalize_state(loaded_state)
     open_positions: dict = state.setdefault("open_positions", {})
 
     lookback_minutes = int(os.getenv("LONGSHOT_LOOKBACK_MINUTES", "240"))
@@ -508,8 +609,9 @@ def run_once() -> int:
     hold_grace_hours = int(os.getenv("LONGSHOT_HOLD_GRACE_HOURS", "24"))
     fallback_order_size = float(os.getenv("LONGSHOT_ORDER_SIZE", "5"))
     max_actions = int(os.getenv("LONGSHOT_MAX_ACTIONS_PER_CYCLE", "1"))
+    scan_workers = int(os.getenv("LONGSHOT_SCAN_WORKERS", str(_SCAN_WORKERS)))
 
-    pmd = PMDClient(api_key=pmd_api_key)
+    pmd = _shared_pmd_client(pmd_api_key)
 
     # --- Live balance fetch (self-correcting bankroll) ---
     # In live mode, read the actual USDC balance from Polymarket and use it
@@ -539,7 +641,7 @@ def run_once() -> int:
                     live_bankroll_usd,
                     min_notional,
                 )
-                _save_state(state_path, state)
+                _save_state(state_path, state, state_snapshot)
                 return 0
         else:
             LOGGER.warning("balance_fetch_failed — falling back to LONGSHOT_BANKROLL_USD")
@@ -579,7 +681,7 @@ def run_once() -> int:
 
     guardrail_error = _evaluate_guardrail(state, now)
     if guardrail_error:
-        _save_state(state_path, state)
+        _save_state(state_path, state, state_snapshot)
         raise RuntimeError(guardrail_error)
 
     candidates = _scan_candidates(
@@ -594,6 +696,7 @@ def run_once() -> int:
         max_spread=max_spread,
         max_rel_spread=max_rel_spread,
         open_positions=open_positions,
+        workers=scan_workers,
     )
 
     LOGGER.info(
@@ -695,5 +798,5 @@ def run_once() -> int:
     state["last_run_at"] = now.isoformat()
     state["last_candidates"] = len(candidates)
     state["open_position_count"] = len(open_positions)
-    _save_state(state_path, state)
+    _save_state(state_path, state, state_snapshot)
     return actions
@@ -0,0 +1,70 @@
+"""
+Tests for MarketCatalog's conditional (ETag) requests.
+"""
+from __future__ import annotations
+
+import json
+
+from polyautomate.data import catalog
+from polyautomate.data.catalog import MarketCatalog
+
+
+class _FakeResponse:
+    reason = ""
+    text = ""
+
+    def __init__(self, status_code: int, payload=None, etag: str | None = None):
+        self.status_code = status_code
+        self.content = b"" if payload is None else json.dumps(payload).encode()
+        self.headers = {"ETag": etag} if etag else {}
+
+
+class _FakeSession:
+    """Serves one ETag-versioned body per path; answers 304 when If-None-Match matches."""
+
+    def __init__(self):
+        self.version = 1
+        self.requests: list[tuple[str, str | None]] = []
+
+    def get(self, url, *, params=None, headers=None, timeout=None):
+        inm = (headers or {}).get("If-None-Match")
+        self.requests.append((url, inm))
+        etag = f'"v{self.version}"'
+        if inm == etag:
+            return _FakeResponse(304)
+        item = {"id": str(self.version), "slug": (params or {}).get("slug", ""), "question": "Q", "markets": []}
+        return _FakeResponse(200, [item], etag)
+
+
+class TestConditionalRequests:
+
+    def test_304_returns_independent_copy(self):
+        session = _FakeSession()
+        cat = MarketCatalog(session=session)
+        first = cat._request("/events", params={"slug": "a"})
+        first[0]["title"] = "mutated"
+        second = cat._request("/events", params={"slug": "a"})
+        assert session.requests[-1][1] == '"v1"'  # revalidated, answered 304
+        assert second == [{"id": "1", "slug": "a", "question": "Q", "markets": []}]
+        assert second is not first
+
+    def test_304_reuses_market_index(self):
+        session = _FakeSession()
+        cat = MarketCatalog(session=session)
+        first = cat.search_markets()
+        assert cat.search_markets() == first
+        assert session.requests[-1][1] == '"v1"'
+        session.version = 2
+        assert [m.id for m in cat.search_markets()] == ["2"]
+
+    def test_cache_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(catalog, "_CONDITIONAL_CACHE_SIZE", 3)
+        session = _FakeSession()
+        cat = MarketCatalog(session=session)
+        for slug in "abcd":
+            cat.get_event(slug)
+        assert len(cat._conditional) == 3
+        cat.get_event("a")  # evicted: fetched without If-None-Match
+        cat.get_event("d")  # still cached: revalidated
+        assert session.requests[-2][1] is None
+        assert session.requests[-1][1] == '"v1"'
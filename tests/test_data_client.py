@@ -0,0 +1,71 @@
+"""
+Tests for PolymarketDataClient's on-disk price history cache.
+"""
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from polyautomate.clients.data import PolymarketDataClient
+
+
+class _FakeResponse:
+    status_code = 200
+    reason = "OK"
+    text = ""
+
+    def __init__(self, payload):
+        self.content = json.dumps(payload).encode()
+
+
+class _FakeSession:
+    """Serves one hourly point per hour of the requested window and counts calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def request(self, method, url, *, params=None, **kwargs):
+        self.calls += 1
+        start, end = params["startTs"], params["endTs"]
+        points = [{"t": t, "p": 0.5 + (t % 7) / 100} for t in range(start, end + 1, 3600)]
+        return _FakeResponse({"history": points})
+
+
+def _client(tmp_path) -> tuple[PolymarketDataClient, _FakeSession]:
+    session = _FakeSession()
+    return PolymarketDataClient(session=session, cache_dir=str(tmp_path)), session
+
+
+class TestHistoryCache:
+
+    def test_past_window_is_served_from_disk(self, tmp_path):
+        client, session = _client(tmp_path)
+        end = int(time.time()) - 86_400
+        window = dict(start_time=end - 10 * 3600, end_time=end)
+        ts, prices = client.get_price_history_arrays("m", "tok", **window)
+        cached_ts, cached_prices = client.get_price_history_arrays("m", "tok", **window)
+        points = client.get_price_history("m", "tok", **window)
+        assert session.calls == 1
+        assert cached_ts.tolist() == ts.tolist() and cached_prices.tolist() == prices.tolist()
+        assert [int(p.timestamp.timestamp()) for p in points] == ts.tolist()
+        assert list(tmp_path.glob("*.npz"))
+
+    @pytest.mark.parametrize("end_offset", [0, 600, -3600])
+    def test_recent_window_is_refetched(self, tmp_path, end_offset):
+        client, session = _client(tmp_path)
+        end = int(time.time()) - end_offset
+        window = dict(start_time=end - 10 * 3600, end_time=end)
+        for _ in range(2):
+            client.get_price_history_arrays("m", "tok", **window)
+            client.get_price_history("m", "tok", **window)
+        assert session.calls == 4
+        assert not list(tmp_path.glob("*.npz"))
+
+    def test_different_windows_miss(self, tmp_path):
+        client, session = _client(tmp_path)
+        end = int(time.time()) - 86_400
+        client.get_price_history_arrays("m", "tok", start_time=end - 10 * 3600, end_time=end)
+        client.get_price_history_arrays("m", "tok", start_time=end - 20 * 3600, end_time=end)
+        assert session.calls == 2
@@ -0,0 +1,27 @@
+"""
+Tests for the executor loop's idle backoff.
+"""
+from __future__ import annotations
+
+import pytest
+
+from polyautomate.runtime.executor_bot import _next_delay
+
+
+class TestNextDelay:
+
+    def test_no_backoff_when_cap_is_poll_interval(self):
+        assert [_next_delay(30, 30, idle) for idle in range(8)] == [30] * 8
+
+    def test_doubles_per_idle_cycle_up_to_cap(self):
+        assert [_next_delay(30, 900, idle) for idle in range(7)] == [30, 60, 120, 240, 480, 900, 900]
+
+    def test_exponent_is_bounded(self):
+        assert _next_delay(1, 10**9, 1000) == 32
+
+    @pytest.mark.parametrize("idle", [0, -1])
+    def test_active_cycle_uses_poll_interval(self, idle):
+        assert _next_delay(30, 900, idle) == 30
+
+    def test_cap_below_poll_interval_is_ignored(self):
+        assert _next_delay(30, 10, 3) == 30
@@ -0,0 +1,139 @@
+"""
+Tests for the streaming indicator helpers in analytics/indicators.py.
+
+Each streaming helper must reproduce its plain-list counterpart exactly,
+including when the caller skips bars (e.g. while a position is open).
+"""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from polyautomate.analytics.indicators import (
+    FEATURE_NAMES,
+    RollingBollinger,
+    RollingRSI,
+    bollinger,
+    compute_feature_matrix,
+    compute_features,
+    rsi,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _random_walk(n: int, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    prices = [0.5]
+    for _ in range(n - 1):
+        step = rng.choice([-0.01, 0.0, 0.0, 0.01, 0.02])
+        prices.append(min(0.99, max(0.01, prices[-1] + step)))
+    return prices
+
+
+def _windows(prices: list[float], window: int):
+    """Yield (index, trailing window) pairs the way BacktestEngine does."""
+    for i in range(window - 1, len(prices)):
+        yield i, prices[i - window + 1 : i + 1]
+
+
+# ---------------------------------------------------------------------------
+# RollingRSI
+# ---------------------------------------------------------------------------
+
+class TestRollingRSI:
+
+    def test_matches_rsi_every_bar(self):
+        prices = _random_walk(400)
+        roll = RollingRSI(14)
+        for _, hist in _windows(prices, 48):
+            assert roll.update(hist) == pytest.approx(rsi(hist, 14), abs=1e-9)
+
+    def test_resyncs_after_skipped_bars(self):
+        prices = _random_walk(400, seed=3)
+        roll = RollingRSI(14)
+        for i, hist in _windows(prices, 48):
+            if i % 17 < 5:
+                continue  # caller did not evaluate these bars
+            assert roll.update(hist) == pytest.approx(rsi(hist, 14), abs=1e-9)
+
+    def test_insufficient_history(self):
+        assert RollingRSI(14).update([0.5] * 10) is None
+
+    @pytest.mark.parametrize("tail_step", [0.0, 0.001, -0.001])
+    def test_long_walk_then_one_sided_tail(self, tail_step):
+        # Rounding residue in the running sums must not leak into a window
+        # with no losses (RSI exactly 100) or no gains (exactly 0).
+        rng = random.Random(4)
+        prices = [rng.random()]
+        for _ in range(3000):
+            prices.append(prices[-1] + rng.gauss(0.0, 0.01))
+        for _ in range(60):
+            prices.append(prices[-1] + tail_step)
+        roll = RollingRSI(14)
+        for _, hist in _windows(prices, 48):
+            assert roll.update(hist) == pytest.approx(rsi(hist, 14), abs=1e-9)
+
+
+# ---------------------------------------------------------------------------
+# RollingBollinger
+# ---------------------------------------------------------------------------
+
+class TestRollingBollinger:
+
+    def test_matches_bollinger_every_bar(self):
+        prices = _random_walk(400, seed=9)
+        roll = RollingBollinger(20)
+        for i, hist in _windows(prices, 48):
+            if i % 23 < 3:
+                continue  # skipped bars force a re-seed
+            got, expected = roll.update(hist), bollinger(hist, 20)
+            assert got.mid == pytest.approx(expected.mid, abs=1e-12)
+            assert got.upper == pytest.approx(expected.upper, abs=1e-9)
+            assert got.z == pytest.approx(expected.z, rel=1e-6, abs=1e-9)
+
+    def test_flat_window_has_zero_z(self):
+        roll = RollingBollinger(5)
+        prices = [0.3, 0.41, 0.2, 0.35] + [0.37] * 10
+        for i in range(5, len(prices) + 1):
+            bb = roll.update(prices[:i])
+        assert bb.z == 0.0 and bb.mid == 0.37
+
+
+# ---------------------------------------------------------------------------
+# compute_feature_matrix
+# ---------------------------------------------------------------------------
+
+def _random_books(prices: list[float], seed: int = 11) -> list[dict]:
+    rng = random.Random(seed)
+    books = []
+    for ts, p in enumerate(prices):
+        if rng.random() < 0.1:
+            books.append({"ts": ts, "bids": [], "asks": []})
+            continue
+        bids = [[round(p - 0.01 * k, 4), rng.uniform(10, 500)] for k in range(1, 4)]
+        asks = [[round(p + 0.01 * k, 4), rng.uniform(10, 500)] for k in range(1, 4)]
+        books.append({"ts": ts, "bids": bids, "asks": asks})
+    return books
+
+
+class TestComputeFeatureMatrix:
+
+    def test_rows_match_compute_features(self):
+        prices = _random_walk(200, seed=5)
+        books = _random_books(prices)
+        matrix = compute_feature_matrix(prices, books, window=48)
+        assert matrix.shape == (200, len(FEATURE_NAMES))
+        assert np.isnan(matrix[:47]).all()
+        for i, hist in _windows(prices, 48):
+            expected = [np.nan if v is None else v for v in compute_features(hist, books[i])]
+            np.testing.assert_allclose(matrix[i], expected, rtol=1e-9, atol=1e-12)
+
+    def test_short_series_is_all_nan(self):
+        prices = _random_walk(10)
+        matrix = compute_feature_matrix(prices, _random_books(prices), window=48)
+        assert np.isnan(matrix).all()
@@ -6,6 +6,7 @@ All Polymarket API calls are mocked — no real credentials required.
 from __future__ import annotations
 
 import os
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,7 @@ import pytest
 from polyautomate.runtime.longshot_executor import (
     _compute_order_size,
     _fetch_usdc_balance,
+    _scan_candidates,
 )
 
 
@@ -281,6 +283,7 @@ class TestRunOnceBalanceGuard:
              patch.object(mod, "PolymarketTradingClient") as mock_trader_cls, \
              patch.object(mod, "_fetch_usdc_balance", return_value=balance_return), \
              patch.object(mod, "PMDClient") as mock_pmd_cls, \
+             patch.dict(mod._PMD_CLIENTS, clear=True), \
              patch.object(mod, "_load_state", return_value={}), \
              patch.object(mod, "_save_state"):
 
@@ -319,6 +322,7 @@ class TestRunOnceBalanceGuard:
         with patch.dict(os.environ, env, clear=False), \
              patch.object(mod, "_fetch_usdc_balance") as mock_fetch, \
              patch.object(mod, "PMDClient") as mock_pmd_cls, \
+             patch.dict(mod._PMD_CLIENTS, clear=True), \
              patch.object(mod, "_load_state", return_value={}), \
              patch.object(mod, "_save_state"):
 
@@ -328,3 +332,48 @@ class TestRunOnceBalanceGuard:
             mod.run_once()
 
         mock_fetch.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# _scan_candidates
+# ---------------------------------------------------------------------------
+
+class TestScanCandidates:
+
+    @staticmethod
+    def _client(yes_prices: dict[str, float]) -> MagicMock:
+        client = MagicMock()
+        client.list_markets.return_value = [
+            {
+                "slug": slug,
+                "question": f"Will {slug} happen?",
+                "tokens": [{"token_id": f"{slug}-y", "outcome": "Yes"}, {"token_id": f"{slug}-n", "outcome": "No"}],
+            }
+            for slug in yes_prices
+        ]
+        client.get_prices.side_effect = lambda slug, *a, **k: {
+            "Yes": [{"p": yes_prices[slug]}],
+            "No": [{"p": 1 - yes_prices[slug]}],
+        }
+        client.get_metrics.return_value = [{"spread": 0.001}]
+        return client
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_open_positions_are_not_fetched(self, workers):
+        client = self._client({"a": 0.2, "b": 0.1, "c": 0.3})
+        candidates = _scan_candidates(
+            client,
+            now=datetime(2030, 1, 1, tzinfo=timezone.utc),
+            lookback_minutes=60,
+            market_limit=10,
+            min_days_left=0,
+            longshot_threshold=0.4,
+            min_price=0.02,
+            max_price=0.96,
+            max_spread=0.03,
+            max_rel_spread=0.15,
+            open_positions={"b": {}},
+            workers=workers,
+        )
+        assert [c.slug for c in candidates] == ["a", "c"]
+        assert sorted(call.args[0] for call in client.get_prices.call_args_list) == ["a", "c"]
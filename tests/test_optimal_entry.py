@@ -0,0 +1,150 @@
+"""
+Tests for the optimal-entry profile scanner and ProfileStrategy.
+"""
+from __future__ import annotations
+
+import math
+
+import numpy as np
+import pytest
+
+from polyautomate.analytics.models import Signal
+from polyautomate.analytics.strategies.optimal_entry import EntryProfile, ProfileStrategy
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+def _reference_distance(features, mean, std):
+    """Plain-Python standardised Euclidean distance (the original loop)."""
+    total = 0.0
+    count = 0
+    for x, mu, sigma in zip(features, mean, std):
+        if x is None or sigma == 0.0:
+            continue
+        total += ((x - mu) / sigma) ** 2
+        count += 1
+    return math.sqrt(total / count) if count > 0 else float("inf")
+
+
+def _profile(mean, std):
+    return EntryProfile(
+        signal=Signal.BUY,
+        feature_names=[f"f{i}" for i in range(len(mean))],
+        mean=mean,
+        std=std,
+        n_samples=10,
+    )
+
+
+# ---------------------------------------------------------------------------
+# EntryProfile.distance
+# ---------------------------------------------------------------------------
+
+class TestEntryProfileDistance:
+
+    def test_matches_reference_loop(self):
+        mean = [50.0, -0.5, 0.001, 0.02, 0.01, 0.5, 0.1, 0.02]
+        std = [10.0, 1.0, 0.002, 0.0, 0.005, 0.1, 0.3, 0.01]
+        feats = [42.0, None, 0.003, 0.5, 0.012, 0.61, None, 0.03]
+        expected = _reference_distance(feats, mean, std)
+        assert _profile(mean, std).distance(feats) == pytest.approx(expected)
+
+    def test_all_features_missing_is_inf(self):
+        assert _profile([1.0, 2.0], [1.0, 1.0]).distance([None, None]) == float("inf")
+
+    def test_zero_std_features_are_skipped(self):
+        assert _profile([1.0, 2.0], [0.0, 0.0]).distance([5.0, 5.0]) == float("inf")
+
+    def test_exact_match_is_zero(self):
+        assert _profile([1.0, 2.0], [0.5, 0.5]).distance([1.0, 2.0]) == 0.0
+
+    def test_fp32_close_to_fp64(self):
+        mean = [50.0, -0.5, 0.001, 0.02, 0.01, 0.5, 0.1, 0.02]
+        std = [10.0, 1.0, 0.002, 0.0, 0.005, 0.1, 0.3, 0.01]
+        feats = [42.0, None, 0.003, 0.5, 0.012, 0.61, None, 0.03]
+        p32 = EntryProfile(Signal.BUY, [f"f{i}" for i in range(8)], mean, std, 10, fp32=True)
+        expected = _reference_distance(feats, mean, std)
+        assert p32.distance(feats) == pytest.approx(expected, rel=1e-5)
+        assert p32.distances(np.array([feats], dtype=float)).dtype == np.float32
+
+
+# ---------------------------------------------------------------------------
+# ProfileStrategy.precompute_distances
+# ---------------------------------------------------------------------------
+
+class TestPrecomputeDistances:
+
+    def test_matches_on_step(self):
+        prices = [0.5 + 0.1 * math.sin(i / 7.0) + 0.01 * (i % 3) for i in range(150)]
+        books = [
+            {"ts": i, "bids": [[p - 0.01, 100.0 + i]], "asks": [[p + 0.01, 120.0]]}
+            for i, p in enumerate(prices)
+        ]
+        profile = _profile(
+            [45.0, 0.0, 0.0, 0.0, 0.02, 0.5, 0.0, 0.02],
+            [15.0, 1.0, 0.01, 0.05, 0.01, 0.1, 0.5, 0.01],
+        )
+        live = ProfileStrategy(profile, max_distance=100.0, min_confidence=0.0)
+        batch = ProfileStrategy(profile, max_distance=100.0, min_confidence=0.0)
+        dist = batch.precompute_distances(prices, books, window=48)
+        assert np.isinf(dist[:47]).all()
+        for i in range(47, len(prices)):
+            kwargs = dict(
+                timestamp=i,
+                price=prices[i],
+                book=books[i],
+                price_history=prices[i - 47 : i + 1],
+                book_history=books[i - 47 : i + 1],
+            )
+            expected = live.on_step(**kwargs).metadata["distance"]
+            assert dist[i] == pytest.approx(expected, rel=1e-9)
+            assert batch.on_step(**kwargs).metadata["distance"] == pytest.approx(expected, rel=1e-9)
+
+    @pytest.mark.parametrize("window", [48, 24])
+    def test_second_market_with_same_timestamps(self, window):
+        # Distances precomputed for one market must not be served for another
+        # market replayed over the same timestamps, nor for another window.
+        profile = _profile(
+            [45.0, 0.0, 0.0, 0.0, 0.02, 0.5, 0.0, 0.02],
+            [15.0, 1.0, 0.01, 0.05, 0.01, 0.1, 0.5, 0.01],
+        )
+        first = [0.5 + 0.1 * math.sin(i / 7.0) for i in range(120)]
+        second = [0.4 + 0.05 * math.cos(i / 5.0) for i in range(120)]
+        first_books = [
+            {"ts": i, "bids": [[p - 0.01, 100.0]], "asks": [[p + 0.01, 120.0]]} for i, p in enumerate(first)
+        ]
+        second_books = [
+            {"ts": i, "bids": [[p - 0.02, 300.0]], "asks": [[p + 0.01, 50.0]]} for i, p in enumerate(second)
+        ]
+        strategy = ProfileStrategy(profile, max_distance=100.0, min_confidence=0.0)
+        live = ProfileStrategy(profile, max_distance=100.0, min_confidence=0.0)
+        strategy.precompute_distances(first, first_books, window=48)
+        for i in range(window - 1, len(second)):
+            kwargs = dict(
+                timestamp=i,
+                price=second[i],
+                book=second_books[i],
+                price_history=second[i - window + 1 : i + 1],
+                book_history=second_books[i - window + 1 : i + 1],
+            )
+            expected = live.on_step(**kwargs).metadata["distance"]
+            assert strategy.on_step(**kwargs).metadata["distance"] == expected
+
+
+# ---------------------------------------------------------------------------
+# EntryProfile persistence
+# ---------------------------------------------------------------------------
+
+class TestEntryProfileNpz:
+
+    def test_round_trip(self, tmp_path):
+        profile = _profile([1.0, 2.5, -0.3], [0.5, 0.0, 0.1])
+        profile.training_market = "some-market"
+        path = tmp_path / "profile.npz"
+        profile.to_npz(path)
+        loaded = EntryProfile.from_npz(path)
+        assert loaded == profile
+        assert loaded.mean.dtype == np.float64
+        assert loaded.distance([1.2, 2.0, None]) == profile.distance([1.2, 2.0, None])
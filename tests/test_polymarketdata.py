@@ -0,0 +1,85 @@
+"""
+Tests for PMDClient history fetching (sharding, page merging, columns).
+
+The HTTP layer is replaced by an in-memory fake of the paginated history
+endpoints, serving realistic ``{t: ISO-8601, p: float}`` price points.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from polyautomate.clients.polymarketdata import PMDClient
+
+_T0 = datetime(2024, 10, 1, tzinfo=timezone.utc)
+
+
+def _parse(value: str) -> datetime:
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class _FakeAPI:
+    """Hourly bars over an inclusive [start_ts, end_ts], paged by ``limit``."""
+
+    def __init__(self, n_bars: int):
+        self.bars = [_T0 + timedelta(hours=i) for i in range(n_bars)]
+        self.requests: list[dict] = []
+
+    def __call__(self, path, params=None):
+        self.requests.append(dict(params))
+        lo, hi = _parse(params["start_ts"]), _parse(params["end_ts"])
+        bars = [b for b in self.bars if lo <= b <= hi]
+        offset = int(params.get("cursor", 0))
+        page = bars[offset : offset + params["limit"]]
+        more = offset + len(page) < len(bars)
+        data = {
+            "Yes": [{"t": b.isoformat(), "p": round(0.1 + 0.001 * self.bars.index(b), 4)} for b in page],
+            "No": [{"t": b.isoformat(), "p": round(0.9 - 0.001 * self.bars.index(b), 4)} for b in page],
+        }
+        return {"data": data, "metadata": {"next_cursor": str(offset + len(page)) if more else None}}
+
+
+def _client(api: _FakeAPI) -> PMDClient:
+    client = PMDClient(api_key="test")
+    client._get = api
+    return client
+
+
+class TestShardedPrices:
+
+    @pytest.mark.parametrize("n_bars,limit", [(3, 1), (50, 7), (120, 24)])
+    def test_matches_unsharded(self, n_bars, limit):
+        api = _FakeAPI(n_bars)
+        end = _T0 + timedelta(hours=n_bars - 1)
+        serial = _client(api).get_prices("m", _T0, end, "1h", limit=limit)
+        sharded = _client(api).get_prices("m", _T0, end, "1h", limit=limit, workers=4)
+        assert len(serial["Yes"]) == n_bars
+        assert sharded == serial
+
+    def test_shards_send_iso_bounds(self):
+        api = _FakeAPI(10)
+        _client(api).get_prices("m", _T0, _T0 + timedelta(hours=9), "1h", limit=3, workers=4)
+        assert len(api.requests) > 1
+        for params in api.requests:
+            assert _parse(params["start_ts"]) and _parse(params["end_ts"])
+
+    def test_points_without_timestamps_are_kept(self):
+        result = [{"p": 0.1}]
+        PMDClient._merge_points(result, [{"p": 0.2}], True)
+        assert result == [{"p": 0.1}, {"p": 0.2}]
+
+
+class TestPricesArrays:
+
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_columns_match_get_prices(self, workers):
+        api = _FakeAPI(30)
+        end = _T0 + timedelta(hours=29)
+        points = _client(api).get_prices("m", _T0, end, "1h", limit=7)
+        arrays = _client(api).get_prices_arrays("m", _T0, end, "1h", limit=7, workers=workers)
+        for label in ("Yes", "No"):
+            ts, price = arrays[label]
+            assert ts.tolist() == [int(_parse(p["t"]).timestamp()) for p in points[label]]
+            assert price.tolist() == [p["p"] for p in points[label]]
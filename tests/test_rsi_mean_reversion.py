@@ -0,0 +1,134 @@
+"""
+Tests for RSIMeanReversionStrategy.batch_signals and BacktestEngine.run_vectorized.
+"""
+from __future__ import annotations
+
+import random
+
+import numpy as np
+import pytest
+
+from polyautomate.analytics.engine import BacktestEngine
+from polyautomate.analytics.models import Signal
+from polyautomate.analytics.strategies.rsi_mean_reversion import RSIMeanReversionStrategy
+
+
+def _random_walk(n: int, seed: int = 7) -> list[float]:
+    rng = random.Random(seed)
+    prices = [0.5]
+    for _ in range(n - 1):
+        step = rng.choice([-0.02, -0.01, 0.0, 0.01, 0.02])
+        prices.append(min(0.99, max(0.01, prices[-1] + step)))
+    return prices
+
+
+class TestBatchSignals:
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"bb_confirm": True, "bb_z_min": 0.5},
+            {"trend_filter": True, "trend_lookback": 12, "trend_threshold": 0.04},
+            {"book_pressure_confirm": True},
+        ],
+    )
+    def test_matches_on_step(self, kwargs):
+        prices = _random_walk(400)
+        rng = random.Random(1)
+        books = [
+            {"ts": i, "bids": [[p - 0.01, rng.uniform(10, 500)]], "asks": [[p + 0.01, rng.uniform(10, 500)]]}
+            for i, p in enumerate(prices)
+        ]
+        batch = RSIMeanReversionStrategy(**kwargs)
+        live = RSIMeanReversionStrategy(**kwargs)
+        signals, confidence = batch.batch_signals(prices, books)
+        window = 48
+        for i in range(window - 1, len(prices)):
+            sig = live.on_step(
+                timestamp=i,
+                price=prices[i],
+                book=books[i],
+                price_history=prices[i - window + 1 : i + 1],
+                book_history=books[i - window + 1 : i + 1],
+            )
+            if sig is None:
+                assert signals[i] == 0 and confidence[i] == 0.0
+            else:
+                assert signals[i] == (1 if sig.signal is Signal.BUY else -1)
+                assert confidence[i] == pytest.approx(sig.confidence, abs=1e-9)
+
+    def test_book_pressure_requires_books(self):
+        with pytest.raises(ValueError):
+            RSIMeanReversionStrategy(book_pressure_confirm=True).batch_signals([0.5] * 30)
+
+
+class TestParamChanges:
+
+    def test_mutated_params_match_fresh_strategy(self):
+        prices = _random_walk(300, seed=5)
+        book = {"ts": 0, "bids": [], "asks": []}
+        changes = dict(rsi_period=5, oversold_threshold=40.0, overbought_threshold=65.0, bb_confirm=True, bb_period=8)
+
+        def run(strategy):
+            out = []
+            for i in range(47, len(prices)):
+                hist = prices[i - 47 : i + 1]
+                sig = strategy.on_step(timestamp=i, price=prices[i], book=book, price_history=hist, book_history=[])
+                out.append(None if sig is None else (sig.signal, sig.confidence, sig.metadata["rsi"]))
+            return out
+
+        mutated = RSIMeanReversionStrategy()
+        run(mutated)  # warm the rolling indicators with the defaults
+        for name, value in changes.items():
+            setattr(mutated, name, value)
+        assert mutated.params == RSIMeanReversionStrategy(**changes).params
+        assert run(mutated) == run(RSIMeanReversionStrategy(**changes))
+
+
+class _FakeClient:
+    def __init__(self, prices: list[float]):
+        ts = [1_700_000_000 + 3600 * i for i in range(len(prices))]
+        self._prices = {"YES": [{"t": t, "p": p} for t, p in zip(ts, prices)]}
+        self._books = {
+            "YES": [{"ts": t, "bids": [[p - 0.01, 50.0]], "asks": [[p + 0.01, 80.0]]} for t, p in zip(ts, prices)]
+        }
+
+    def get_prices(self, *args, **kwargs):
+        return self._prices
+
+    def get_books(self, *args, **kwargs):
+        return self._books
+
+
+def _trade_key(trade):
+    return (
+        trade.signal.timestamp,
+        trade.signal.signal,
+        trade.entry_price,
+        trade.exit_price,
+        trade.exit_timestamp,
+        trade.exit_reason,
+    )
+
+
+class TestRunVectorized:
+
+    def test_matches_run(self):
+        engine = BacktestEngine(_FakeClient(_random_walk(1500, seed=4)), cache_dir=None)
+        kwargs = dict(stop_loss=0.02, take_profit=0.03, hold_periods=6, fee_rate=0.01)
+        live = engine.run(RSIMeanReversionStrategy(), "m", "YES", 0, 1, **kwargs)
+        fast = engine.run_vectorized(RSIMeanReversionStrategy(), "m", "YES", 0, 1, **kwargs)
+        assert live.n_trades > 0
+        assert [_trade_key(t) for t in fast.trades] == [_trade_key(t) for t in live.trades]
+
+    def test_sweep_matches_run_vectorized(self):
+        engine = BacktestEngine(_FakeClient(_random_walk(1500, seed=6)), cache_dir=None)
+        sweep = engine.run_sweep(
+            RSIMeanReversionStrategy(), "m", "YES", 0, 1,
+            stop_loss=(0.02, 0.05), take_profit=(0.03,), hold_periods=(6, 24), fee_rate=0.01,
+        )
+        assert len(sweep) == 4
+        for params, result in sweep:
+            single = engine.run_vectorized(RSIMeanReversionStrategy(), "m", "YES", 0, 1, fee_rate=0.01, **params)
+            assert [_trade_key(t) for t in result.trades] == [_trade_key(t) for t in single.trades]
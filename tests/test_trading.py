@@ -0,0 +1,74 @@
+"""
+Tests for PolymarketTradingClient.place_orders batch submission.
+"""
+from __future__ import annotations
+
+import base64
+import json
+
+import httpx
+import pytest
+
+from polyautomate.clients.trading import PolymarketTradingClient
+from polyautomate.exceptions import OrderBatchError, PolymarketAPIError
+from polyautomate.models import OrderRequest, OrderResponse
+
+
+def _client(handler) -> PolymarketTradingClient:
+    client = PolymarketTradingClient(
+        api_key="key",
+        api_secret=base64.urlsafe_b64encode(b"s" * 32).decode(),
+        api_passphrase="pass",
+        address="0x1",
+    )
+    make_client = client._async_client
+
+    def mocked():
+        async_client = make_client()
+        async_client._transport = httpx.MockTransport(handler)
+        return async_client
+
+    client._async_client = mocked
+    return client
+
+
+def _order(token_id: str) -> OrderRequest:
+    return OrderRequest(token_id=token_id, side="buy", price=0.5, size=10, expiration=2_000_000_000)
+
+
+def _reject_bad(request: httpx.Request) -> httpx.Response:
+    """Accept every order except those for token ``bad``."""
+    token_id = json.loads(request.content)["tokenId"]
+    if token_id == "bad":
+        return httpx.Response(400, json={"error": "rejected"})
+    return httpx.Response(200, json={"orderId": f"id-{token_id}", "status": "live"})
+
+
+class TestPlaceOrders:
+
+    def test_all_accepted(self):
+        responses = _client(_reject_bad).place_orders([_order("a"), _order("b")])
+        assert [r.order_id for r in responses] == ["id-a", "id-b"]
+
+    def test_partial_failure_keeps_accepted_orders(self):
+        client = _client(_reject_bad)
+        with pytest.raises(OrderBatchError) as info:
+            client.place_orders([_order("a"), _order("bad"), _order("c")])
+        err = info.value
+        assert isinstance(err, PolymarketAPIError) and err.status_code == 400
+        assert isinstance(err.results[0], OrderResponse) and err.results[0].order_id == "id-a"
+        assert isinstance(err.results[1], PolymarketAPIError)
+        assert err.results[2].order_id == "id-c"
+        assert [r.order_id for r in err.responses] == ["id-a", "id-c"]
+        assert len(err.errors) == 1
+
+    def test_transport_error_is_collected(self):
+        def handler(request):
+            if json.loads(request.content)["tokenId"] == "down":
+                raise httpx.ConnectError("refused", request=request)
+            return _reject_bad(request)
+
+        with pytest.raises(OrderBatchError) as info:
+            _client(handler).place_orders([_order("down"), _order("b")])
+        assert isinstance(info.value.results[0], httpx.ConnectError)
+        assert info.value.results[1].order_id == "id-b"